@@ -6,6 +6,7 @@ a next-generation version solving algorithm for dependency resolution.
 """
 
 from .version import Version, VersionRange, VersionSet
+from .bitset_version_set import BitsetVersionSet
 from .package import Package
 from .term import Term
 from .partial_solution import PartialSolution, Assignment
@@ -18,6 +19,7 @@ __all__ = [
     "Version",
     "VersionRange",
     "VersionSet",
+    "BitsetVersionSet",
     "Package",
     "Term",
     "PartialSolution",
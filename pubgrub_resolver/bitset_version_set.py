@@ -0,0 +1,105 @@
+"""
+Bitset-backed version set for finite version universes.
+
+PubGrub has pathological cases where a package excludes many individual
+versions, which a range-based VersionSet must represent as one micro-range
+per exclusion. When the resolver already knows the full candidate list for
+a package, membership can instead be one bit per candidate in a single
+Python int: complement, union, and intersection each become one C-level
+big-integer operation regardless of how fragmented the set is.
+"""
+
+from __future__ import annotations
+
+from typing import Iterable
+
+from .version import Version
+
+
+class BitsetVersionSet:
+    """Version set over a fixed, finite universe of versions.
+
+    The universe (and its version-to-bit index) is shared between a set
+    and every set derived from it, so derived sets cost one int. Use
+    :meth:`VersionSet.for_universe` to project an open range set onto a
+    known candidate list.
+    """
+
+    __slots__ = ("universe", "_index", "_universe_mask", "_mask")
+
+    def __init__(
+        self, universe: Iterable[Version], members: Iterable[Version] = ()
+    ) -> None:
+        """Initialize with a version universe and the member subset."""
+        self.universe = tuple(universe)
+        self._index = {v: i for i, v in enumerate(self.universe)}
+        self._universe_mask = (1 << len(self.universe)) - 1
+        mask = 0
+        for version in members:
+            index = self._index.get(version)
+            if index is None:
+                raise ValueError(f"Version {version} is not in the universe")
+            mask |= 1 << index
+        self._mask = mask
+
+    def _with_mask(self, mask: int) -> BitsetVersionSet:
+        """Build a set sharing this universe with a different mask."""
+        result = object.__new__(BitsetVersionSet)
+        result.universe = self.universe
+        result._index = self._index
+        result._universe_mask = self._universe_mask
+        result._mask = mask
+        return result
+
+    def _check_universe(self, other: BitsetVersionSet) -> None:
+        if self.universe != other.universe:
+            raise ValueError(
+                "Cannot combine bitset version sets over different universes"
+            )
+
+    def contains(self, version: Version) -> bool:
+        """Check if a version is contained in this set."""
+        index = self._index.get(version)
+        return index is not None and (self._mask >> index) & 1 == 1
+
+    def complement(self) -> BitsetVersionSet:
+        """Compute the complement of this set within its universe."""
+        return self._with_mask(self._universe_mask & ~self._mask)
+
+    def union(self, other: BitsetVersionSet) -> BitsetVersionSet:
+        """Compute the union of two sets over the same universe."""
+        self._check_universe(other)
+        return self._with_mask(self._mask | other._mask)
+
+    def intersect(self, other: BitsetVersionSet) -> BitsetVersionSet:
+        """Compute the intersection of two sets over the same universe."""
+        self._check_universe(other)
+        return self._with_mask(self._mask & other._mask)
+
+    def is_empty(self) -> bool:
+        """Check if this set is empty."""
+        return self._mask == 0
+
+    def versions(self) -> list[Version]:
+        """List the member versions in universe order."""
+        mask = self._mask
+        return [v for i, v in enumerate(self.universe) if (mask >> i) & 1]
+
+    def __len__(self) -> int:
+        return self._mask.bit_count()
+
+    def __str__(self) -> str:
+        if self._mask == 0:
+            return "∅"
+        return "{" + ", ".join(str(v) for v in self.versions()) + "}"
+
+    def __repr__(self) -> str:
+        return f"BitsetVersionSet({self.versions()!r})"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, BitsetVersionSet):
+            return NotImplemented
+        return self.universe == other.universe and self._mask == other._mask
+
+    def __hash__(self) -> int:
+        return hash((self.universe, self._mask))
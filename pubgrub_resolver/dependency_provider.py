@@ -6,7 +6,7 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from .package import Package, Dependency
-from .version import Version
+from .version import Version, parse_version_constraint
 from .term import Term
 
 
@@ -64,11 +64,15 @@ class SimpleDependencyProvider(DependencyProvider):
         self.packages: dict[str, Package] = {}
         self.versions: dict[Package, list[Version]] = {}
         self.dependencies: dict[tuple[Package, Version], list[Dependency]] = {}
+        self.root: Package | None = None
+        self.topological_order: list[Package] | None = None
 
     def add_package(self, package_name: str, is_root: bool = False) -> Package:
         """Add a package to the provider."""
         package = Package(package_name, is_root)
         self.packages[package_name] = package
+        if is_root:
+            self.root = package
         if package not in self.versions:
             self.versions[package] = []
         return package
@@ -81,6 +85,12 @@ class SimpleDependencyProvider(DependencyProvider):
             self.versions[package].append(version)
             self.versions[package].sort()
 
+    def add_versions(self, package: Package, versions: list[Version]) -> None:
+        """Add several versions to a package, sorting once at the end."""
+        existing = self.versions.setdefault(package, [])
+        existing.extend(v for v in versions if v not in existing)
+        existing.sort()
+
     def add_dependency(
         self, package: Package, version: Version, dependency: Dependency
     ) -> None:
@@ -90,6 +100,74 @@ class SimpleDependencyProvider(DependencyProvider):
             self.dependencies[key] = []
         self.dependencies[key].append(dependency)
 
+    def add_dependencies(
+        self, package: Package, version: Version, dependencies: list[Dependency]
+    ) -> None:
+        """Add several dependencies for a package version in one call."""
+        key = (package, version)
+        if key not in self.dependencies:
+            self.dependencies[key] = []
+        self.dependencies[key].extend(dependencies)
+
+    def set_topological_order(self, packages: list[Package]) -> None:
+        """
+        Record a topological ordering hint for the dependency graph.
+
+        ``packages`` lists packages such that every dependency points to an
+        earlier entry (dependencies before dependents). Callers that build
+        their graphs in that order anyway (e.g. linear chains) can pass it
+        along so the resolver may skip the general search when every choice
+        is forced. The hint is advisory: the resolver re-validates it against
+        the actual graph and falls back to the normal path if it does not
+        hold, so a stale or wrong hint affects speed, not correctness.
+        """
+        if any(p.name not in self.packages for p in packages):
+            raise ValueError("Topological order references unknown packages")
+        self.topological_order = list(packages)
+
+    def populate(self, spec: dict[str, dict]) -> dict[str, Package]:
+        """
+        Batch-populate packages, versions, and dependencies from a spec dict.
+
+        ``spec`` maps package names to entries of the form::
+
+            {"versions": ["1.0.0", ...],
+             "deps": {"1.0.0": [("other", ">=1.0.0"), ...]},
+             "is_root": False}
+
+        Dependency constraints use the same mini-language as
+        ``parse_version_constraint``. All packages are created before any
+        dependencies, so targets may be declared in any order. Insertions
+        run in tight loops instead of one method call per version or
+        dependency.
+        """
+        packages: dict[str, Package] = {}
+        for name, entry in spec.items():
+            packages[name] = self.add_package(
+                name, is_root=entry.get("is_root", False)
+            )
+
+        for name, entry in spec.items():
+            package = packages[name]
+            versions = self.versions[package]
+            for version_string in entry.get("versions", ()):
+                version = Version(version_string)
+                if version not in versions:
+                    versions.append(version)
+            versions.sort()
+
+            for version_string, deps in entry.get("deps", {}).items():
+                key = (package, Version(version_string))
+                dep_list = self.dependencies.setdefault(key, [])
+                for dep_name, constraint in deps:
+                    dep_list.append(
+                        Dependency(
+                            packages[dep_name], parse_version_constraint(constraint)
+                        )
+                    )
+
+        return packages
+
     def get_package_versions(self, package: Package) -> list[Version]:
         """Get all available versions for a package."""
         return self.versions.get(package, []).copy()
@@ -104,7 +182,12 @@ class SimpleDependencyProvider(DependencyProvider):
         return package in self.versions
 
     def get_package_by_name(self, name: str) -> Package | None:
-        """Get a package by name."""
+        """Get a package by name.
+
+        A single dict lookup: ``packages`` is maintained as a name-keyed
+        mapping by ``add_package``, so this stays O(1) however many
+        packages the provider holds.
+        """
         return self.packages.get(name)
 
     def __str__(self) -> str:
@@ -9,6 +9,7 @@ from .term import Term
 from .package import Package
 from .partial_solution import PartialSolution
 from .version import Version
+from .interval_tree import IntervalTree
 
 
 class IncompatibilityKind(Enum):
@@ -45,32 +46,28 @@ class Incompatibility:
         self.kind = kind
         self.cause = cause or ""
 
-        # Validate that terms for the same package don't overlap
-        # (but allow self-dependencies which create valid incompatibilities)
-        package_terms: dict[Package, Term] = {}
+        # Per-package term lookup, built once. Terms for the same package
+        # may repeat (e.g. self-dependencies); the first occurrence wins,
+        # matching the old linear scan, and the SAT logic handles the rest.
+        # Propagation queries this dict thousands of times per resolve, so
+        # the layout pays for itself immediately.
+        term_by_package: dict[Package, Term] = {}
         for term in terms:
-            if term.package in package_terms:
-                # Allow multiple terms for same package if they don't overlap
-                # For now, we'll be permissive and allow this case
-                # The SAT solver will handle the logic correctly
-                pass
-            else:
-                package_terms[term.package] = term
+            if term.package not in term_by_package:
+                term_by_package[term.package] = term
+        self._term_by_package = term_by_package
 
     def get_term_for_package(self, package: Package) -> Term | None:
         """Get the term for a specific package, if any."""
-        for term in self.terms:
-            if term.package == package:
-                return term
-        return None
+        return self._term_by_package.get(package)
 
     def has_package(self, package: Package) -> bool:
         """Check if this incompatibility involves a specific package."""
-        return any(term.package == package for term in self.terms)
+        return package in self._term_by_package
 
     def get_packages(self) -> set[Package]:
         """Get all packages involved in this incompatibility."""
-        return {term.package for term in self.terms}
+        return set(self._term_by_package)
 
     def is_satisfied_by(self, solution: PartialSolution) -> bool:
         """Check if this incompatibility is satisfied by a partial solution."""
@@ -233,17 +230,38 @@ class IncompatibilitySet:
         # Optimization cache
         self._satisfied_cache: dict[Incompatibility, bool] = {}
         self._last_solution_level: int = -1
+        # First failure (term-less incompatibility) ever added, tracked at
+        # insert time so propagation does not rescan the whole set for one.
+        self._failure: Incompatibility | None = None
+        # Per-package interval tree over term ranges plus a count of the
+        # positive terms indexed, enough to answer "does version v violate
+        # any term for package p" in O(log n + k) — see is_version_allowed.
+        self._range_index: dict[Package, IntervalTree] = {}
+        self._positive_counts: dict[Package, int] = {}
 
     def add(self, incompatibility: Incompatibility) -> None:
         """Add an incompatibility to the set."""
         self.incompatibilities.append(incompatibility)
 
+        if self._failure is None and incompatibility.is_failure():
+            self._failure = incompatibility
+
         # Index by package for efficient lookup
         for package in incompatibility.get_packages():
             if package not in self._by_package:
                 self._by_package[package] = []
             self._by_package[package].append(incompatibility)
 
+            term = incompatibility.get_term_for_package(package)
+            tree = self._range_index.get(package)
+            if tree is None:
+                tree = self._range_index[package] = IntervalTree()
+            tree.insert(term.version_range, term.positive)
+            if term.positive:
+                self._positive_counts[package] = (
+                    self._positive_counts.get(package, 0) + 1
+                )
+
         # Initialize watched literals
         self._initialize_watched_literals(incompatibility)
 
@@ -251,6 +269,35 @@ class IncompatibilitySet:
         """Get all incompatibilities involving a specific package."""
         return self._by_package.get(package, [])
 
+    def is_version_allowed(self, package: Package, version: Version) -> bool:
+        """Check a version against every indexed term for a package.
+
+        A version is ruled out if any positive term's range excludes it or
+        any negative term's range contains it. A single stabbing query on
+        the package's interval tree answers both: negative hits are direct
+        violations, and a positive-hit count short of the number of
+        positive terms means some positive range missed the version.
+        """
+        tree = self._range_index.get(package)
+        if tree is None:
+            return True
+
+        positive_hits = 0
+        for positive in tree.query_point(version):
+            if positive:
+                positive_hits += 1
+            else:
+                return False
+        return positive_hits == self._positive_counts.get(package, 0)
+
+    def get_failure(self) -> Incompatibility | None:
+        """Return the first failure incompatibility, if one was ever added.
+
+        O(1): the failure is recorded by ``add``, matching what a scan of
+        ``incompatibilities`` in insertion order would find first.
+        """
+        return self._failure
+
     def _initialize_watched_literals(self, incompatibility: Incompatibility) -> None:
         """Initialize watched literals for an incompatibility."""
         terms = incompatibility.terms
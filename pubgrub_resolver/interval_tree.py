@@ -0,0 +1,189 @@
+"""
+Augmented AVL interval tree for indexing VersionRanges.
+
+Maps version intervals to arbitrary payloads and answers stabbing queries
+("which intervals contain this version?") in O(log n + k) instead of the
+O(n) scan a flat list needs. Intervals are keyed by ``Version._cmp_key``
+tuples so every comparison is a C-level tuple compare, and unbounded sides
+use sentinel keys that order before/after every real version key.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from .version import Version, VersionRange
+
+# Sentinel bound keys. The empty tuple sorts before any real comparison key
+# and a lone +infinity first element sorts after all of them, so unbounded
+# range sides need no special cases in the containment checks below.
+_MIN_KEY: tuple = ()
+_MAX_KEY: tuple = (float("inf"),)
+
+
+class _Node:
+    """A single interval with AVL bookkeeping and subtree max-upper bound."""
+
+    __slots__ = (
+        "low",
+        "high",
+        "include_low",
+        "include_high",
+        "payload",
+        "left",
+        "right",
+        "height",
+        "max_upper",
+    )
+
+    def __init__(
+        self,
+        low: tuple,
+        high: tuple,
+        include_low: bool,
+        include_high: bool,
+        payload: Any,
+    ) -> None:
+        self.low = low
+        self.high = high
+        self.include_low = include_low
+        self.include_high = include_high
+        self.payload = payload
+        self.left: _Node | None = None
+        self.right: _Node | None = None
+        self.height = 1
+        self.max_upper = high
+
+
+def _height(node: _Node | None) -> int:
+    return node.height if node is not None else 0
+
+
+def _update(node: _Node) -> None:
+    """Recompute height and max_upper from the children."""
+    node.height = 1 + max(_height(node.left), _height(node.right))
+    max_upper = node.high
+    if node.left is not None and node.left.max_upper > max_upper:
+        max_upper = node.left.max_upper
+    if node.right is not None and node.right.max_upper > max_upper:
+        max_upper = node.right.max_upper
+    node.max_upper = max_upper
+
+
+def _rotate_left(node: _Node) -> _Node:
+    pivot = node.right
+    node.right = pivot.left
+    pivot.left = node
+    _update(node)
+    _update(pivot)
+    return pivot
+
+
+def _rotate_right(node: _Node) -> _Node:
+    pivot = node.left
+    node.left = pivot.right
+    pivot.right = node
+    _update(node)
+    _update(pivot)
+    return pivot
+
+
+def _insert(node: _Node | None, new: _Node) -> _Node:
+    """AVL insert ordered by low bound; equal lows go right."""
+    if node is None:
+        return new
+
+    if new.low < node.low:
+        node.left = _insert(node.left, new)
+    else:
+        node.right = _insert(node.right, new)
+    _update(node)
+
+    balance = _height(node.left) - _height(node.right)
+    if balance > 1:
+        if new.low >= node.left.low:
+            node.left = _rotate_left(node.left)
+        return _rotate_right(node)
+    if balance < -1:
+        if new.low < node.right.low:
+            node.right = _rotate_right(node.right)
+        return _rotate_left(node)
+    return node
+
+
+class IntervalTree:
+    """Interval tree over VersionRanges with payloads.
+
+    Immutable ranges go in via :meth:`insert`; :meth:`query_point` returns
+    the payloads of every stored range containing a version. Deletion is
+    not supported — the resolver only ever accumulates incompatibilities.
+    """
+
+    __slots__ = ("_root", "_size")
+
+    def __init__(self) -> None:
+        self._root: _Node | None = None
+        self._size = 0
+
+    def insert(self, version_range: VersionRange, payload: Any) -> None:
+        """Add a range with its payload to the index."""
+        low = (
+            version_range.min_version._cmp_key
+            if version_range.min_version is not None
+            else _MIN_KEY
+        )
+        high = (
+            version_range.max_version._cmp_key
+            if version_range.max_version is not None
+            else _MAX_KEY
+        )
+        node = _Node(
+            low,
+            high,
+            version_range.include_min,
+            version_range.include_max,
+            payload,
+        )
+        self._root = _insert(self._root, node)
+        self._size += 1
+
+    def query_point(self, version: Version) -> list[Any]:
+        """Return payloads of all stored ranges containing ``version``.
+
+        Walks only subtrees whose bounds can cover the point: a subtree is
+        skipped when its max upper bound lies below the key, and right
+        children are skipped once low bounds exceed it.
+        """
+        results: list[Any] = []
+        root = self._root
+        if root is None:
+            return results
+
+        key = version._cmp_key
+        stack = [root]
+        while stack:
+            node = stack.pop()
+
+            # Nothing in this subtree reaches up to the key.
+            if node.max_upper < key:
+                continue
+
+            if node.left is not None:
+                stack.append(node.left)
+
+            if key >= node.low:
+                if (
+                    (node.include_low or key != node.low)
+                    and (key < node.high or (key == node.high and node.include_high))
+                ):
+                    results.append(node.payload)
+                if node.right is not None:
+                    stack.append(node.right)
+
+        return results
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __repr__(self) -> str:
+        return f"IntervalTree({self._size} intervals)"
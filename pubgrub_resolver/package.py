@@ -4,11 +4,33 @@ Package class for representing software packages.
 
 from __future__ import annotations
 
+from weakref import WeakValueDictionary
+
 from .version import Version, VersionRange
 
+# Interning table for Package instances, keyed by the full identity tuple
+# (equality includes is_root). Weak values let unused packages be collected.
+_package_intern: WeakValueDictionary[tuple[str, bool], Package] = WeakValueDictionary()
+
 
 class Package:
-    """Represents a software package with a name and optional root status."""
+    """Represents a software package with a name and optional root status.
+
+    Instances are interned on (name, is_root): constructing the same package
+    twice returns the same object, so the hash and equality checks that the
+    resolver performs per propagation step hit the identity fast path.
+    """
+
+    __slots__ = ("name", "is_root", "__weakref__")
+
+    def __new__(cls, name: str, is_root: bool = False) -> Package:
+        key = (name, is_root)
+        cached = _package_intern.get(key)
+        if cached is not None:
+            return cached
+        self = object.__new__(cls)
+        _package_intern[key] = self
+        return self
 
     def __init__(self, name: str, is_root: bool = False) -> None:
         self.name = name
@@ -78,6 +100,8 @@ class PackageVersion:
 class Dependency:
     """Represents a dependency relationship between packages."""
 
+    __slots__ = ("package", "version_range")
+
     def __init__(self, package: Package, version_range: VersionRange) -> None:
         self.package = package
         self.version_range = version_range
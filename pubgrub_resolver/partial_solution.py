@@ -127,6 +127,10 @@ class PartialSolution:
         """Get all current assignments."""
         return list(self.assignments.values())
 
+    def assignment_count(self) -> int:
+        """Number of current assignments, without materializing a list."""
+        return len(self.assignments)
+
     def copy(self) -> PartialSolution:
         """Create a copy of this partial solution."""
         copy_solution = PartialSolution()
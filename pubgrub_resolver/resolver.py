@@ -43,13 +43,35 @@ class PubGrubResolver:
         self.root_package: Package | None = None
         self.conflict_resolver = ConflictResolver()
         self.explainer = ConflictExplainer()
+        self._result_cache: dict[tuple[Package, Version], ResolutionResult] = {}
 
     def resolve(self, root_package: Package, root_version: Version) -> ResolutionResult:
         """
         Resolve dependencies starting from a root package.
 
         Returns a ResolutionResult containing the solution or error information.
+        Resolution is deterministic for a fixed provider, so successful
+        results are cached per (package, version) root; call
+        :meth:`clear_result_cache` after mutating the provider.
         """
+        cache_key = (root_package, root_version)
+        cached = self._result_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        result = self._resolve_uncached(root_package, root_version)
+        if result.success:
+            self._result_cache[cache_key] = result
+        return result
+
+    def clear_result_cache(self) -> None:
+        """Drop cached resolution results (after provider changes)."""
+        self._result_cache.clear()
+
+    def _resolve_uncached(
+        self, root_package: Package, root_version: Version
+    ) -> ResolutionResult:
+        """Run the full resolution algorithm, bypassing the result cache."""
         try:
             self.root_package = root_package
             self.solution = PartialSolution()
@@ -57,6 +79,12 @@ class PubGrubResolver:
             self.conflict_resolver = ConflictResolver()
             self.explainer = ConflictExplainer()
 
+            # Fast path: if the provider supplied a topological ordering and
+            # every choice along it is forced, skip the general search.
+            fast_result = self._try_topological_fast_path(root_package, root_version)
+            if fast_result is not None:
+                return fast_result
+
             # Add root constraint
             self._add_root_constraint(root_package, root_version)
 
@@ -79,6 +107,57 @@ class PubGrubResolver:
         except Exception as e:
             return ResolutionResult(False, None, f"Resolver error: {str(e)}")
 
+    def _try_topological_fast_path(
+        self, root_package: Package, root_version: Version
+    ) -> ResolutionResult | None:
+        """
+        Attempt a single linear sweep using the provider's topological hint.
+
+        Providers may advertise a ``topological_order`` (see
+        ``SimpleDependencyProvider.set_topological_order``) listing packages
+        with dependencies before dependents. When the root is the last entry
+        and every dependency admits exactly one available version, the whole
+        solution is forced and can be assigned in one pass without unit
+        propagation or conflict resolution.
+
+        Returns None whenever the hint is absent, inconsistent with the
+        actual graph, or leaves any version choice open — the caller then
+        runs the general algorithm, so the hint can never change results.
+        """
+        order = getattr(self.provider, "topological_order", None)
+        if not order or order[-1] != root_package:
+            return None
+
+        position = {package: i for i, package in enumerate(order)}
+
+        # Walk from the root backwards; each package's dependencies must
+        # point strictly earlier in the order and be forced to one version.
+        needed: dict[Package, Version] = {root_package: root_version}
+        for i in range(len(order) - 1, -1, -1):
+            package = order[i]
+            version = needed.get(package)
+            if version is None:
+                continue
+            if version not in self.provider.get_package_versions(package):
+                return None
+            for dependency in self.provider.get_dependencies(package, version):
+                dep_position = position.get(dependency.package)
+                if dep_position is None or dep_position >= i:
+                    return None  # hint does not match the graph
+                candidates = [
+                    v
+                    for v in self.provider.get_package_versions(dependency.package)
+                    if dependency.version_range.contains(v)
+                ]
+                if len(candidates) != 1:
+                    return None  # a real choice remains; needs the search
+                if needed.setdefault(dependency.package, candidates[0]) != candidates[0]:
+                    return None
+
+        for package, version in needed.items():
+            self.solution.assign(package, version, 0)
+        return ResolutionResult(True, self.solution, None)
+
     def _add_root_constraint(
         self, root_package: Package, root_version: Version
     ) -> None:
@@ -99,10 +178,12 @@ class PubGrubResolver:
         while changed:
             changed = False
 
-            # Check for failure incompatibilities first
-            for incompatibility in self.incompatibilities.get_all():
-                if incompatibility.is_failure():
-                    return ResolutionResult(False, None, incompatibility.cause)
+            # Check for failure incompatibilities first; the set tracks the
+            # first one at insert time, so this is O(1) per pass instead of
+            # a copy-and-scan of every incompatibility.
+            failure = self.incompatibilities.get_failure()
+            if failure is not None:
+                return ResolutionResult(False, None, failure.cause)
 
             # Find unit clauses
             unit_clauses = self.incompatibilities.find_unit_clauses(self.solution)
@@ -324,15 +405,10 @@ class PubGrubResolver:
 
     def _is_version_compatible(self, package: Package, version: Version) -> bool:
         """Check if a version is compatible with existing constraints."""
-        # Check all incompatibilities involving this package
-        for incompatibility in self.incompatibilities.get_for_package(package):
-            term = incompatibility.get_term_for_package(package)
-            if term is not None:
-                # Check if this version would violate the term
-                if term.positive and not term.version_range.contains(version):
-                    return False
-                elif not term.positive and term.version_range.contains(version):
-                    return False
+        # Check the version against every term mentioning this package via
+        # the set's interval-tree index instead of scanning incompatibilities.
+        if not self.incompatibilities.is_version_allowed(package, version):
+            return False
 
         # Also check if this version would create future conflicts
         return not self._would_create_future_conflicts(package, version)
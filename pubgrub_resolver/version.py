@@ -5,40 +5,187 @@ Version and VersionRange classes for semantic version handling.
 from __future__ import annotations
 
 import re
-from functools import total_ordering
+from functools import lru_cache, total_ordering
+from operator import attrgetter
+from typing import Iterable
+from weakref import WeakValueDictionary
+
+# Compiled once at import; calling re.match with a string pattern would pay
+# a cache lookup in the re module on every Version construction.
+_SEMVER_RE = re.compile(
+    r"^(\d+)\.(\d+)\.(\d+)(?:-([a-zA-Z0-9.-]+))?(?:\+([a-zA-Z0-9.-]+))?$"
+)
+_EXACT_VERSION_RE = re.compile(r"^\d+\.\d+\.\d+")
+
+# Key used by _prerelease_key for stable releases; a lone (2, ...) entry
+# compares greater than any tuple of numeric (0, ...) or alphanumeric
+# (1, ...) identifiers, encoding "stable sorts after every pre-release".
+_STABLE_KEY = ((2, 0, ""),)
+
+
+def _prerelease_key(pre_release: str | None) -> tuple[tuple[int, int, str], ...]:
+    """Ordering key for a pre-release string per SemVer item 11.
+
+    Dot-separated identifiers compare numerically when they are digits and
+    lexically otherwise, with numeric identifiers ordering before
+    alphanumeric ones and a shorter identifier list before a longer prefix
+    match. Each identifier maps to a uniformly typed triple so tuple
+    comparison stays in C.
+    """
+    if pre_release is None:
+        return _STABLE_KEY
+    return tuple(
+        (0, int(part), "") if part.isdigit() else (1, 0, part)
+        for part in pre_release.split(".")
+    )
+
+
+# Interning table for Version instances, keyed by the exact version string.
+# Weak values keep the table from pinning versions that nothing else holds.
+_version_intern: WeakValueDictionary[str, Version] = WeakValueDictionary()
+
+# Bound once for Version.sort_many; attrgetter runs without a Python frame.
+_CMP_KEY_GETTER = attrgetter("_cmp_key")
+
+# Sort key for VersionSet.complement: the fused low bound orders unbounded
+# minima first and breaks ties toward the inclusive bound.
+_LO_GETTER = attrgetter("_lo")
+
+# Probe extraction for VersionSet.contains_many batch queries.
+_PROBE_GETTER = attrgetter("_probe")
 
 
 @total_ordering
 class Version:
-    """Represents a semantic version (e.g., "1.2.3")."""
+    """Represents a semantic version (e.g., "1.2.3").
+
+    Instances are interned by their version string: constructing the same
+    string twice returns the same object, so the heavy resolver paths that
+    rebuild identical versions pay for parsing once and equality checks hit
+    the identity fast path.
+    """
+
+    __slots__ = (
+        "version_string",
+        "major",
+        "minor",
+        "patch",
+        "pre_release",
+        "build",
+        "_cmp_key",
+        "_probe",
+        "_hash",
+        "__weakref__",
+    )
+
+    def __new__(cls, version_string: str) -> Version:
+        cached = _version_intern.get(version_string)
+        if cached is not None:
+            return cached
+        self = object.__new__(cls)
+        _version_intern[version_string] = self
+        return self
 
     def __init__(self, version_string: str) -> None:
+        if hasattr(self, "major"):
+            return  # interned instance, already parsed
         self.version_string = version_string
         self._parse_version()
 
     def _parse_version(self) -> None:
         """Parse version string into components."""
-        # Simple semantic version parsing
-        match = re.match(
-            r"^(\d+)\.(\d+)\.(\d+)(?:-([a-zA-Z0-9.-]+))?(?:\+([a-zA-Z0-9.-]+))?$",
-            self.version_string,
-        )
+        version_string = self.version_string
+
+        # Fast path: plain release versions ("1.2.3") dominate in practice
+        # and split/isdigit beats the regex engine for them. Anything with
+        # pre-release or build metadata falls through to the full pattern.
+        if "-" not in version_string and "+" not in version_string:
+            parts = version_string.split(".")
+            if len(parts) == 3 and all(p.isdigit() for p in parts):
+                self.major = int(parts[0])
+                self.minor = int(parts[1])
+                self.patch = int(parts[2])
+                self.pre_release = None
+                self.build = None
+                self._cmp_key = (self.major, self.minor, self.patch, _STABLE_KEY)
+                self._probe = (self._cmp_key, 0)
+                self._hash = hash(version_string)
+                return
+            raise ValueError(f"Invalid version format: {version_string}")
+
+        match = _SEMVER_RE.match(version_string)
         if not match:
-            raise ValueError(f"Invalid version format: {self.version_string}")
+            raise ValueError(f"Invalid version format: {version_string}")
 
         self.major = int(match.group(1))
         self.minor = int(match.group(2))
         self.patch = int(match.group(3))
         self.pre_release = match.group(4)
         self.build = match.group(5)
+        # Comparison key, precomputed once so __lt__ does not rebuild the
+        # same tuple (or re-derive pre-release ordering) on every call in
+        # resolver hot loops.
+        self._cmp_key = (
+            self.major,
+            self.minor,
+            self.patch,
+            _prerelease_key(self.pre_release),
+        )
+        # Probe form of the key for containment tests against the fused
+        # range bounds; allocated once here instead of per contains() call.
+        self._probe = (self._cmp_key, 0)
+        self._hash = hash(version_string)
+
+    @classmethod
+    def from_ints(cls, major: int, minor: int, patch: int) -> Version:
+        """Build a release version directly from integer components.
+
+        Skips regex parsing entirely; useful for callers that generate
+        versions programmatically rather than from user input.
+        """
+        version_string = f"{major}.{minor}.{patch}"
+        cached = _version_intern.get(version_string)
+        if cached is not None:
+            return cached
+        version = object.__new__(cls)
+        version.version_string = version_string
+        version.major = major
+        version.minor = minor
+        version.patch = patch
+        version.pre_release = None
+        version.build = None
+        version._cmp_key = (major, minor, patch, _STABLE_KEY)
+        version._probe = (version._cmp_key, 0)
+        version._hash = hash(version_string)
+        _version_intern[version_string] = version
+        return version
+
+    @classmethod
+    def sort_many(cls, versions: Iterable[Version]) -> list[Version]:
+        """Sort versions using the precomputed comparison key.
+
+        ``sorted(versions)`` dispatches ``__lt__`` through a Python frame
+        per comparison; extracting ``_cmp_key`` once per element keeps the
+        O(n log n) comparison work entirely in C tuple code.
+        """
+        return sorted(versions, key=_CMP_KEY_GETTER)
 
     def __str__(self) -> str:
+        """Return the version string captured at construction.
+
+        The string is stored rather than reformatted, so repeated calls
+        (result collection, error messages) cost a single attribute load.
+        """
         return self.version_string
 
     def __repr__(self) -> str:
         return f"Version('{self.version_string}')"
 
     def __eq__(self, other: object) -> bool:
+        # Interning makes equal versions usually the same object, so the
+        # identity test settles most comparisons without touching strings.
+        if self is other:
+            return True
         if not isinstance(other, Version):
             return NotImplemented
         return self.version_string == other.version_string
@@ -47,34 +194,41 @@ class Version:
         if not isinstance(other, Version):
             return NotImplemented
 
-        # Compare major, minor, patch
-        if (self.major, self.minor, self.patch) != (
-            other.major,
-            other.minor,
-            other.patch,
-        ):
-            return (self.major, self.minor, self.patch) < (
-                other.major,
-                other.minor,
-                other.patch,
-            )
-
-        # Handle pre-release versions
-        if self.pre_release is None and other.pre_release is None:
-            return False
-        elif self.pre_release is None:
-            return False  # 1.0.0 > 1.0.0-alpha
-        elif other.pre_release is None:
-            return True  # 1.0.0-alpha < 1.0.0
-        else:
-            return self.pre_release < other.pre_release
+        # The precomputed key already encodes release ordering and the
+        # SemVer pre-release rules, so this is one C-level tuple compare.
+        return self._cmp_key < other._cmp_key
 
     def __hash__(self) -> int:
-        return hash(self.version_string)
+        # Computed once at construction; versions key dicts and sets all
+        # over the resolver, so re-hashing the string each time adds up.
+        return self._hash
+
+
+# Sentinel keys for unbounded range sides in the fused bound tuples below;
+# the empty tuple sorts before every real comparison key and a lone
+# +infinity element sorts after all of them.
+_UNBOUNDED_LOW: tuple = ()
+_UNBOUNDED_HIGH: tuple = (float("inf"),)
 
 
 class VersionRange:
-    """Represents a range of acceptable versions."""
+    """Represents a range of acceptable versions.
+
+    Each bound is also precomputed as a fused ``(cmp_key, tiebreak)`` tuple
+    (``_lo``/``_hi``) that folds the inclusivity flag into the ordering: an
+    exclusive minimum sorts just above its key and an exclusive maximum just
+    below, so containment and emptiness reduce to plain tuple comparisons
+    with no per-call branching on flags or None bounds.
+    """
+
+    __slots__ = (
+        "min_version",
+        "max_version",
+        "include_min",
+        "include_max",
+        "_lo",
+        "_hi",
+    )
 
     def __init__(
         self,
@@ -87,79 +241,32 @@ class VersionRange:
         self.max_version = max_version
         self.include_min = include_min
         self.include_max = include_max
+        self._lo = (
+            min_version._cmp_key if min_version is not None else _UNBOUNDED_LOW,
+            0 if include_min else 1,
+        )
+        self._hi = (
+            max_version._cmp_key if max_version is not None else _UNBOUNDED_HIGH,
+            0 if include_max else -1,
+        )
 
     def contains(self, version: Version) -> bool:
-        """Check if a version is within this range."""
-        if self.min_version is not None:
-            if self.include_min:
-                if version < self.min_version:
-                    return False
-            else:
-                if version <= self.min_version:
-                    return False
-
-        if self.max_version is not None:
-            if self.include_max:
-                if version > self.max_version:
-                    return False
-            else:
-                if version >= self.max_version:
-                    return False
+        """Check if a version is within this range.
 
-        return True
+        A version's precomputed probe key sits between the fused bounds
+        exactly when the version lies in the range, so both sides check
+        in one chained tuple comparison with no allocation.
+        """
+        return self._lo <= version._probe <= self._hi
 
     def intersect(self, other: VersionRange) -> VersionRange | None:
-        """Compute the intersection of two version ranges."""
-        # Determine new minimum
-        new_min = None
-        new_include_min = True
-
-        if self.min_version is None:
-            new_min = other.min_version
-            new_include_min = other.include_min
-        elif other.min_version is None:
-            new_min = self.min_version
-            new_include_min = self.include_min
-        else:
-            if self.min_version > other.min_version:
-                new_min = self.min_version
-                new_include_min = self.include_min
-            elif self.min_version < other.min_version:
-                new_min = other.min_version
-                new_include_min = other.include_min
-            else:  # Equal
-                new_min = self.min_version
-                new_include_min = self.include_min and other.include_min
-
-        # Determine new maximum
-        new_max = None
-        new_include_max = False
-
-        if self.max_version is None:
-            new_max = other.max_version
-            new_include_max = other.include_max
-        elif other.max_version is None:
-            new_max = self.max_version
-            new_include_max = self.include_max
-        else:
-            if self.max_version < other.max_version:
-                new_max = self.max_version
-                new_include_max = self.include_max
-            elif self.max_version > other.max_version:
-                new_max = other.max_version
-                new_include_max = other.include_max
-            else:  # Equal
-                new_max = self.max_version
-                new_include_max = self.include_max and other.include_max
+        """Compute the intersection of two version ranges.
 
-        # Check if range is valid
-        if new_min is not None and new_max is not None:
-            if new_min > new_max:
-                return None
-            elif new_min == new_max and not (new_include_min and new_include_max):
-                return None
-
-        return VersionRange(new_min, new_max, new_include_min, new_include_max)
+        Delegates to a cached free function: ranges are immutable and the
+        resolver intersects the same (dependency, candidate) pairs over and
+        over, so repeated calls collapse to a dict hit.
+        """
+        return _intersect_ranges(self, other)
 
     def union(self, other: VersionRange) -> list[VersionRange]:
         """
@@ -257,19 +364,12 @@ class VersionRange:
         return VersionRange(new_min, new_max, new_include_min, new_include_max)
 
     def is_empty(self) -> bool:
-        """Check if this range is empty."""
-        if self.min_version is None and self.max_version is None:
-            return False
-
-        if self.min_version is not None and self.max_version is not None:
-            if self.min_version > self.max_version:
-                return True
-            elif self.min_version == self.max_version and not (
-                self.include_min and self.include_max
-            ):
-                return True
+        """Check if this range is empty.
 
-        return False
+        The fused bounds make this a single comparison: a crossed pair
+        covers both min > max and an equal point with an excluded side.
+        """
+        return self._lo > self._hi
 
     def __str__(self) -> str:
         if self.min_version is None and self.max_version is None:
@@ -305,8 +405,44 @@ class VersionRange:
         )
 
 
+@lru_cache(maxsize=4096)
+def _intersect_ranges(a: VersionRange, b: VersionRange) -> VersionRange | None:
+    """Cached kernel of VersionRange.intersect.
+
+    Pure function of two immutable, hashable ranges, so memoization needs
+    no invalidation. The bound size keeps pathological workloads from
+    growing the table without limit.
+    """
+    # The fused bounds order exclusive minima above and exclusive maxima
+    # below their keys, so the tighter bound on each side is a plain tuple
+    # max/min: on ties the exclusive bound wins, which is exactly the
+    # "intersect the inclusivity" rule the branchy version spelled out.
+    lo_src = a if a._lo >= b._lo else b
+    hi_src = a if a._hi <= b._hi else b
+
+    # Crossed bounds mean the ranges are disjoint (or one was empty).
+    if lo_src._lo > hi_src._hi:
+        return None
+
+    return VersionRange(
+        lo_src.min_version,
+        hi_src.max_version,
+        lo_src.include_min,
+        hi_src.include_max,
+    )
+
+
 class VersionSet:
-    """Represents a set of version ranges (union of disjoint ranges)."""
+    """Represents a set of version ranges (union of disjoint ranges).
+
+    Alongside the ``ranges`` list, the fused bound keys of every range are
+    gathered into one flat ``_bounds`` tuple at construction. Membership
+    queries scan that compact structure-of-arrays layout instead of
+    pointer-chasing through the range objects, which keeps the inner loop
+    on C-level tuple comparisons.
+    """
+
+    __slots__ = ("ranges", "_bounds", "_sorted", "_is_empty", "_complement_cache")
 
     def __init__(
         self, ranges: list[VersionRange] | None = None, normalize: bool = True
@@ -315,14 +451,21 @@ class VersionSet:
         self.ranges = ranges or []
         if normalize:
             self._normalize()
+        self._bounds = tuple((r._lo, r._hi) for r in self.ranges)
+        self._is_empty = not self.ranges or all(r.is_empty() for r in self.ranges)
+        # Normalization leaves the ranges in ascending bound order; callers
+        # passing normalize=False promise nothing, so mark those unsorted
+        # unless they are trivially so.
+        self._sorted = normalize or len(self.ranges) <= 1
+        self._complement_cache: VersionSet | None = None
 
     def _normalize(self) -> None:
         """Normalize the ranges by merging overlapping/adjacent ranges."""
         if not self.ranges:
             return
 
-        # Sort ranges by minimum version
-        self.ranges.sort(key=lambda r: (r.min_version is None, r.min_version))
+        # Sort ranges ascending by fused low bound (unbounded minima first)
+        self.ranges.sort(key=_LO_GETTER)
 
         # Merge overlapping/adjacent ranges
         merged = [self.ranges[0]]
@@ -342,6 +485,12 @@ class VersionSet:
 
     def intersect(self, other: VersionSet) -> VersionSet:
         """Compute the intersection of two version sets."""
+        # An empty operand decides the result without the O(n*m) range
+        # walk; the resolver intersects freshly complemented sets with
+        # incompatibility terms constantly, so this fires often.
+        if self._is_empty or other._is_empty:
+            return VersionSet([])
+
         result_ranges = []
         for range1 in self.ranges:
             for range2 in other.ranges:
@@ -351,91 +500,125 @@ class VersionSet:
         return VersionSet(result_ranges)
 
     def contains(self, version: Version) -> bool:
-        """Check if a version is contained in this set."""
-        return any(range_obj.contains(version) for range_obj in self.ranges)
+        """Check if a version is contained in this set.
+
+        The version's precomputed probe key is compared against the
+        packed bound pairs; no range object is touched in the loop, and
+        the explicit loop skips the generator frame ``any()`` would spin
+        up on every call.
+        """
+        probe = version._probe
+        for lo, hi in self._bounds:
+            if lo <= probe <= hi:
+                return True
+        return False
+
+    def contains_many(self, versions: Iterable[Version]) -> list[bool]:
+        """Check containment for a batch of versions in one pass.
+
+        Binds the packed bounds once and reuses them for every probe, so
+        checking a package's whole candidate list avoids the per-call
+        attribute loads of repeated :meth:`contains` calls.
+        """
+        bounds = self._bounds
+        return [
+            any(lo <= probe <= hi for lo, hi in bounds)
+            for probe in map(_PROBE_GETTER, versions)
+        ]
 
     def is_empty(self) -> bool:
-        """Check if this set is empty."""
-        return len(self.ranges) == 0 or all(r.is_empty() for r in self.ranges)
+        """Check if this set is empty.
 
-    def complement(self) -> VersionSet:
-        """Compute the complement of this version set."""
-        if self.is_empty():
-            # Complement of empty set is the universal set
-            return VersionSet([VersionRange()])
-
-        # Normalize the ranges first (merge overlapping ranges)
-        normalized_ranges = []
-        for r in self.ranges:
-            if not r.is_empty():
-                normalized_ranges.append(r)
-
-        if not normalized_ranges:
-            return VersionSet([VersionRange()])
-
-        # Sort ranges by their minimum version
-        sorted_ranges = sorted(
-            normalized_ranges,
-            key=lambda r: (r.min_version or Version("0.0.0"), r.include_min),
-        )
+        Computed once at construction (the ranges never change after
+        that), so repeated emptiness checks are an attribute load.
+        """
+        return self._is_empty
 
-        complement_ranges = []
-
-        # Handle the range before the first range
-        first_range = sorted_ranges[0]
-        if first_range.min_version is not None:
-            # Add range from negative infinity to the start of first range
-            complement_ranges.append(
-                VersionRange(
-                    min_version=None,
-                    max_version=first_range.min_version,
-                    include_min=True,
-                    include_max=not first_range.include_min,
-                )
-            )
-
-        # Handle gaps between ranges
-        for i in range(len(sorted_ranges) - 1):
-            current_range = sorted_ranges[i]
-            next_range = sorted_ranges[i + 1]
-
-            # Check if there's a gap between current and next range
-            if (
-                current_range.max_version is not None
-                and next_range.min_version is not None
-            ):
-                # There's a potential gap
-                if current_range.max_version < next_range.min_version or (
-                    current_range.max_version == next_range.min_version
-                    and not (current_range.include_max and next_range.include_min)
-                ):
-                    # Add the gap as a range
-                    complement_ranges.append(
-                        VersionRange(
-                            min_version=current_range.max_version,
-                            max_version=next_range.min_version,
-                            include_min=not current_range.include_max,
-                            include_max=not next_range.include_min,
-                        )
-                    )
-
-        # Handle the range after the last range
-        last_range = sorted_ranges[-1]
-        if last_range.max_version is not None:
-            # Add range from end of last range to positive infinity
-            complement_ranges.append(
-                VersionRange(
-                    min_version=last_range.max_version,
-                    max_version=None,
-                    include_min=not last_range.include_max,
-                    include_max=False,
-                )
-            )
+    def for_universe(self, versions: list[Version]) -> "BitsetVersionSet":
+        """Project this set onto a finite version universe as a bitset.
 
-        # Filter out empty ranges
-        complement_ranges = [r for r in complement_ranges if not r.is_empty()]
+        Useful once the candidate list for a package is known: set algebra
+        on the result is single big-integer operations instead of range
+        walks, which matters for heavily fragmented exclusion sets.
+        """
+        from .bitset_version_set import BitsetVersionSet
+
+        return BitsetVersionSet(
+            versions, [v for v in versions if self.contains(v)]
+        )
 
-        return VersionSet(complement_ranges, normalize=False)
+    def complement(self) -> VersionSet:
+        """Compute the complement of this version set.
+
+        Single merge-style scan: each input range (in ascending order)
+        emits the gap between the previous covered region and its own
+        minimum, and a final slot covers the tail out to infinity. The
+        output list is pre-sized to the worst case (N inputs produce at
+        most N + 1 gaps) and truncated after the walk, so the whole
+        operation is one linear pass with no intermediate lists.
+
+        The returned set's ranges are in ascending bound order; callers
+        may rely on that instead of re-sorting. Being a pure function of
+        the (immutable) ranges, the result is memoized on the instance,
+        and the involution links back: ``s.complement().complement()``
+        returns ``s`` itself without recomputation.
+        """
+        cached = self._complement_cache
+        if cached is not None:
+            return cached
+
+        ranges = [r for r in self.ranges if not r.is_empty()]
+        if not ranges:
+            # Complement of the empty set is the universal set.
+            result = VersionSet([VersionRange()], normalize=False)
+            result._complement_cache = self
+            self._complement_cache = result
+            return result
+
+        # Normalized sets (and complement outputs) are already in ascending
+        # bound order; only normalize=False inputs still need the sort.
+        if not self._sorted:
+            ranges.sort(key=_LO_GETTER)
+
+        out: list[VersionRange | None] = [None] * (len(ranges) + 1)
+        written = 0
+        # Left edge of the next gap: starts at minus infinity, advances to
+        # just past each range's maximum as the scan consumes it.
+        prev_max: Version | None = None
+        prev_include = True
+        prev_hi: tuple | None = None
+
+        for r in ranges:
+            # Ranges fully inside the region covered so far contribute
+            # neither a gap nor a new right edge.
+            if prev_hi is not None and r._hi <= prev_hi:
+                continue
+            if r.min_version is not None:
+                gap = VersionRange(
+                    prev_max, r.min_version, prev_include, not r.include_min
+                )
+                # Adjacent inputs (e.g. [1,2) then [2,3)) produce an empty
+                # point gap; checking here fuses the old filter pass into
+                # the emission itself.
+                if not gap.is_empty():
+                    out[written] = gap
+                    written += 1
+            prev_max = r.max_version
+            prev_include = not r.include_max
+            prev_hi = r._hi
+
+        # Trailing gap from the last covered maximum to plus infinity.
+        if prev_max is not None:
+            out[written] = VersionRange(prev_max, None, prev_include, False)
+            written += 1
+
+        result = VersionSet(out[:written], normalize=False)
+        # The scan walks sorted input, so the gaps come out sorted too;
+        # recording that lets chained complements skip their sort.
+        result._sorted = True
+        result._complement_cache = self
+        self._complement_cache = result
+        return result
 
     def __str__(self) -> str:
         if not self.ranges:
@@ -488,7 +671,7 @@ def parse_version_constraint(constraint: str) -> VersionRange:
         return VersionRange(min_version, max_version, min_inclusive, max_inclusive)
 
     # Handle specific version
-    if re.match(r"^\d+\.\d+\.\d+", constraint):
+    if _EXACT_VERSION_RE.match(constraint):
         version = Version(constraint)
         return VersionRange(version, version, True, True)
 
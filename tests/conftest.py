@@ -0,0 +1,56 @@
+"""Shared fixtures for the test suite."""
+
+import os
+
+import pytest
+from hypothesis import settings
+
+from pubgrub_resolver.dependency_provider import SimpleDependencyProvider
+
+# Hypothesis profiles: routine CI runs a small example budget; nightly or
+# local deep runs opt in with HYPOTHESIS_PROFILE=thorough. Tests that leave
+# max_examples unset inherit the loaded profile's budget.
+settings.register_profile("ci", max_examples=10, deadline=None, database=None)
+settings.register_profile("thorough", max_examples=200, deadline=None)
+settings.load_profile(os.environ.get("HYPOTHESIS_PROFILE", "ci"))
+
+
+def hash_spec(spec: dict) -> tuple:
+    """Reduce a ``populate()`` spec dict to a canonical hashable form."""
+    return tuple(
+        (
+            name,
+            entry.get("is_root", False),
+            tuple(entry.get("versions", ())),
+            tuple(
+                (version, tuple(deps))
+                for version, deps in entry.get("deps", {}).items()
+            ),
+        )
+        for name, entry in sorted(spec.items())
+    )
+
+
+_provider_cache: dict[tuple, SimpleDependencyProvider] = {}
+
+
+@pytest.fixture
+def provider_from():
+    """
+    Build (or reuse) a provider from a ``populate()`` spec dict.
+
+    Providers are only read during resolution, so tests whose specs are
+    structurally identical can share a single cached instance instead of
+    rebuilding the same package graph per test.
+    """
+
+    def build(spec: dict) -> SimpleDependencyProvider:
+        key = hash_spec(spec)
+        provider = _provider_cache.get(key)
+        if provider is None:
+            provider = SimpleDependencyProvider()
+            provider.populate(spec)
+            _provider_cache[key] = provider
+        return provider
+
+    return build
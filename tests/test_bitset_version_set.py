@@ -0,0 +1,67 @@
+"""Tests for the bitset-backed version set over finite universes."""
+
+import pytest
+
+from pubgrub_resolver.bitset_version_set import BitsetVersionSet
+from pubgrub_resolver.version import Version, VersionRange, VersionSet
+
+UNIVERSE = [Version(f"{i}.0.0") for i in range(1, 6)]
+V1, V2, V3, V4, V5 = UNIVERSE
+
+
+class TestBitsetVersionSet:
+    """Test BitsetVersionSet set algebra and the VersionSet projection."""
+
+    def test_membership(self):
+        """Members are contained; non-members and outsiders are not."""
+        bitset = BitsetVersionSet(UNIVERSE, [V1, V3])
+
+        assert bitset.contains(V1)
+        assert not bitset.contains(V2)
+        assert bitset.contains(V3)
+        assert not bitset.contains(Version("9.0.0"))
+        assert len(bitset) == 2
+
+    def test_complement(self):
+        """Complement flips membership within the universe."""
+        bitset = BitsetVersionSet(UNIVERSE, [V1, V3])
+        complement = bitset.complement()
+
+        assert complement.versions() == [V2, V4, V5]
+        assert complement.complement() == bitset
+
+    def test_union_and_intersection(self):
+        """Union and intersection are plain mask operations."""
+        a = BitsetVersionSet(UNIVERSE, [V1, V2])
+        b = BitsetVersionSet(UNIVERSE, [V2, V3])
+
+        assert a.union(b).versions() == [V1, V2, V3]
+        assert a.intersect(b).versions() == [V2]
+        assert a.intersect(b.complement()).versions() == [V1]
+
+    def test_empty_set(self):
+        """An empty set has no members and a full complement."""
+        empty = BitsetVersionSet(UNIVERSE)
+
+        assert empty.is_empty()
+        assert empty.versions() == []
+        assert empty.complement().versions() == UNIVERSE
+
+    def test_mismatched_universes_raise(self):
+        """Combining sets over different universes is an error."""
+        a = BitsetVersionSet(UNIVERSE, [V1])
+        b = BitsetVersionSet(UNIVERSE[:3], [V1])
+
+        with pytest.raises(ValueError, match="different universes"):
+            a.union(b)
+
+        with pytest.raises(ValueError, match="not in the universe"):
+            BitsetVersionSet(UNIVERSE[:3], [V5])
+
+    def test_for_universe_projection(self):
+        """VersionSet.for_universe keeps exactly the contained candidates."""
+        range_set = VersionSet([VersionRange(V2, V4, True, True)])
+        bitset = range_set.for_universe(UNIVERSE)
+
+        assert bitset.versions() == [V2, V3, V4]
+        assert bitset.complement().versions() == [V1, V5]
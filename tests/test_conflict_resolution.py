@@ -1,63 +1,60 @@
 """Tests for conflict resolution and CDCL functionality."""
 
-from pubgrub_resolver.dependency_provider import SimpleDependencyProvider
-from pubgrub_resolver.package import Dependency
-from pubgrub_resolver.version import Version, VersionRange
+import pytest
+
+from pubgrub_resolver.version import Version
 from pubgrub_resolver.resolver import PubGrubResolver
 
+# Shared version constants; Version is immutable and value-equal, so
+# constructing these once avoids reparsing the same literals in every test.
+V1 = Version("1.0.0")
+V2 = Version("2.0.0")
+
+# root needs both a and b; a 2.0.0 and b 2.0.0 place conflicting
+# requirements on c, so the resolver must back off to older versions.
+CONFLICT_SPEC = {
+    "root": {
+        "is_root": True,
+        "versions": ["1.0.0"],
+        "deps": {"1.0.0": [("a", ">=1.0.0"), ("b", ">=1.0.0")]},
+    },
+    "a": {
+        "versions": ["1.0.0", "2.0.0"],
+        "deps": {"2.0.0": [("c", ">=2.0.0")]},
+    },
+    "b": {
+        "versions": ["1.0.0", "2.0.0"],
+        "deps": {"2.0.0": [("c", "<2.0.0")]},
+    },
+    "c": {"versions": ["1.0.0", "2.0.0"]},
+}
+
+# root needs b >= 1.0.0 while a (also required) needs b < 1.0.0, so no
+# assignment can ever satisfy both.
+UNSOLVABLE_SPEC = {
+    "root": {
+        "is_root": True,
+        "versions": ["1.0.0"],
+        "deps": {"1.0.0": [("a", ">=1.0.0"), ("b", ">=1.0.0")]},
+    },
+    "a": {
+        "versions": ["1.0.0"],
+        "deps": {"1.0.0": [("b", "<1.0.0")]},
+    },
+    "b": {"versions": ["1.0.0"]},
+}
+
 
 class TestConflictResolution:
     """Test cases for conflict resolution in the PubGrub resolver."""
 
-    def create_conflict_test_provider(self):
-        """Create a test provider with conflicting dependencies."""
-        provider = SimpleDependencyProvider()
-
-        # Add packages
-        root = provider.add_package("root", is_root=True)
-        a = provider.add_package("a")
-        b = provider.add_package("b")
-        c = provider.add_package("c")
-
-        # Add versions
-        provider.add_version(root, Version("1.0.0"))
-        provider.add_version(a, Version("1.0.0"))
-        provider.add_version(a, Version("2.0.0"))
-        provider.add_version(b, Version("1.0.0"))
-        provider.add_version(b, Version("2.0.0"))
-        provider.add_version(c, Version("1.0.0"))
-        provider.add_version(c, Version("2.0.0"))
-
-        # Create conflicting dependencies
-        # root depends on a >= 1.0.0 and b >= 1.0.0
-        provider.add_dependency(
-            root, Version("1.0.0"), Dependency(a, VersionRange(Version("1.0.0"), None))
-        )
-        provider.add_dependency(
-            root, Version("1.0.0"), Dependency(b, VersionRange(Version("1.0.0"), None))
-        )
-
-        # a 2.0.0 depends on c >= 2.0.0
-        provider.add_dependency(
-            a, Version("2.0.0"), Dependency(c, VersionRange(Version("2.0.0"), None))
-        )
-
-        # b 2.0.0 depends on c < 2.0.0 (conflict!)
-        provider.add_dependency(
-            b,
-            Version("2.0.0"),
-            Dependency(c, VersionRange(None, Version("2.0.0"), True, False)),
-        )
-
-        return provider
-
-    def test_conflict_resolution_finds_solution(self):
+    def test_conflict_resolution_finds_solution(self, provider_from):
         """Test that conflict resolution finds a valid solution when possible."""
-        provider = self.create_conflict_test_provider()
+        provider = provider_from(CONFLICT_SPEC)
         root_package = provider.get_package_by_name("root")
 
         resolver = PubGrubResolver(provider)
-        result = resolver.resolve(root_package, Version("1.0.0"))
+        result = resolver.resolve(root_package, V1)
 
         # Should find a solution by using older versions
         assert result.success is True
@@ -76,7 +73,7 @@ class TestConflictResolution:
         assert "c" in assignments
 
         # Verify the solution is consistent
-        assert assignments["root"] == Version("1.0.0")
+        assert assignments["root"] == V1
 
         # Verify the solution satisfies all constraints
         # If a=2.0.0 and b=2.0.0, then we have a conflict (impossible)
@@ -85,29 +82,29 @@ class TestConflictResolution:
         b_version = assignments["b"]
         c_version = assignments["c"]
 
-        if a_version == Version("2.0.0") and b_version == Version("2.0.0"):
+        if a_version == V2 and b_version == V2:
             # This combination should be impossible due to conflicting c requirements
             assert False, "Invalid solution: a=2.0.0 and b=2.0.0 creates conflict on c"
 
         # If a=2.0.0, then c must be >= 2.0.0
-        if a_version == Version("2.0.0"):
-            assert c_version >= Version("2.0.0"), (
+        if a_version == V2:
+            assert c_version >= V2, (
                 f"a=2.0.0 requires c>=2.0.0, got c={c_version}"
             )
 
         # If b=2.0.0, then c must be < 2.0.0
-        if b_version == Version("2.0.0"):
-            assert c_version < Version("2.0.0"), (
+        if b_version == V2:
+            assert c_version < V2, (
                 f"b=2.0.0 requires c<2.0.0, got c={c_version}"
             )
 
-    def test_conflict_resolution_statistics(self):
+    def test_conflict_resolution_statistics(self, provider_from):
         """Test that conflict resolution provides useful statistics."""
-        provider = self.create_conflict_test_provider()
+        provider = provider_from(CONFLICT_SPEC)
         root_package = provider.get_package_by_name("root")
 
         resolver = PubGrubResolver(provider)
-        resolver.resolve(root_package, Version("1.0.0"))
+        resolver.resolve(root_package, V1)
 
         # Get resolution statistics
         stats = resolver.get_resolution_statistics()
@@ -124,45 +121,14 @@ class TestConflictResolution:
         assert stats["total_conflicts"] >= 0
         assert stats["max_decision_level"] >= 0
 
-    def create_unsolvable_test_provider(self):
-        """Create a test provider with truly unsolvable conflicts."""
-        provider = SimpleDependencyProvider()
-
-        # Add packages
-        root = provider.add_package("root", is_root=True)
-        a = provider.add_package("a")
-        b = provider.add_package("b")
-
-        # Add versions
-        provider.add_version(root, Version("1.0.0"))
-        provider.add_version(a, Version("1.0.0"))
-        provider.add_version(b, Version("1.0.0"))
-
-        # Create unsolvable dependencies
-        # root depends on a >= 1.0.0 and b >= 1.0.0
-        provider.add_dependency(
-            root, Version("1.0.0"), Dependency(a, VersionRange(Version("1.0.0"), None))
-        )
-        provider.add_dependency(
-            root, Version("1.0.0"), Dependency(b, VersionRange(Version("1.0.0"), None))
-        )
-
-        # a 1.0.0 depends on b < 1.0.0 (impossible!)
-        provider.add_dependency(
-            a,
-            Version("1.0.0"),
-            Dependency(b, VersionRange(None, Version("1.0.0"), True, False)),
-        )
-
-        return provider
-
-    def test_unsolvable_conflict_detection(self):
+    @pytest.mark.timeout(2)
+    def test_unsolvable_conflict_detection(self, provider_from):
         """Test that unsolvable conflicts are properly detected."""
-        provider = self.create_unsolvable_test_provider()
+        provider = provider_from(UNSOLVABLE_SPEC)
         root_package = provider.get_package_by_name("root")
 
         resolver = PubGrubResolver(provider)
-        result = resolver.resolve(root_package, Version("1.0.0"))
+        result = resolver.resolve(root_package, V1)
 
         # Should fail to find a solution
         assert result.success is False
@@ -170,13 +136,17 @@ class TestConflictResolution:
         assert result.error is not None
         assert "conflict" in result.error.lower()
 
-    def test_cdcl_learned_clauses(self):
+        # Proving UNSAT must go through conflict resolution, not a trivial
+        # refusal; pin that the CDCL machinery actually ran.
+        assert resolver.get_resolution_statistics()["total_conflicts"] > 0
+
+    def test_cdcl_learned_clauses(self, provider_from):
         """Test that CDCL learns clauses from conflicts."""
-        provider = self.create_conflict_test_provider()
+        provider = provider_from(CONFLICT_SPEC)
         root_package = provider.get_package_by_name("root")
 
         resolver = PubGrubResolver(provider)
-        resolver.resolve(root_package, Version("1.0.0"))
+        resolver.resolve(root_package, V1)
 
         # Check that the conflict resolver has learned clauses
         learned_clauses = resolver.conflict_resolver.learned_clauses
@@ -190,13 +160,13 @@ class TestConflictResolution:
             assert hasattr(clause, "terms")
             assert hasattr(clause, "kind")
 
-    def test_conflict_history_tracking(self):
+    def test_conflict_history_tracking(self, provider_from):
         """Test that conflict history is properly tracked."""
-        provider = self.create_conflict_test_provider()
+        provider = provider_from(CONFLICT_SPEC)
         root_package = provider.get_package_by_name("root")
 
         resolver = PubGrubResolver(provider)
-        resolver.resolve(root_package, Version("1.0.0"))
+        resolver.resolve(root_package, V1)
 
         # Check that conflicts were tracked
         conflict_history = resolver.conflict_resolver.conflict_history
@@ -210,13 +180,13 @@ class TestConflictResolution:
             assert hasattr(conflict, "decision_level")
             assert hasattr(conflict, "explanation")
 
-    def test_non_chronological_backtracking(self):
+    def test_non_chronological_backtracking(self, provider_from):
         """Test that non-chronological backtracking is used."""
-        provider = self.create_conflict_test_provider()
+        provider = provider_from(CONFLICT_SPEC)
         root_package = provider.get_package_by_name("root")
 
         resolver = PubGrubResolver(provider)
-        resolver.resolve(root_package, Version("1.0.0"))
+        resolver.resolve(root_package, V1)
 
         # Get statistics to check backtracking behavior
         stats = resolver.get_resolution_statistics()
@@ -0,0 +1,82 @@
+"""
+Tests for the interval tree used to index VersionRanges.
+"""
+
+import random
+
+from pubgrub_resolver.interval_tree import IntervalTree
+from pubgrub_resolver.version import Version, VersionRange
+
+V1 = Version("1.0.0")
+V2 = Version("2.0.0")
+V3 = Version("3.0.0")
+V4 = Version("4.0.0")
+
+
+class TestIntervalTree:
+    """Test IntervalTree insertion and stabbing queries."""
+
+    def test_empty_tree(self):
+        """An empty tree matches nothing."""
+        tree = IntervalTree()
+        assert len(tree) == 0
+        assert tree.query_point(V1) == []
+
+    def test_single_interval(self):
+        """Default [min, max) bounds: min in, max out."""
+        tree = IntervalTree()
+        tree.insert(VersionRange(V1, V3), "a")
+
+        assert tree.query_point(V1) == ["a"]
+        assert tree.query_point(V2) == ["a"]
+        assert tree.query_point(V3) == []
+        assert tree.query_point(V4) == []
+
+    def test_inclusivity_flags(self):
+        """Open and closed bounds are honored at the endpoints."""
+        tree = IntervalTree()
+        tree.insert(VersionRange(V1, V3, False, True), "open-closed")
+
+        assert tree.query_point(V1) == []
+        assert tree.query_point(V2) == ["open-closed"]
+        assert tree.query_point(V3) == ["open-closed"]
+
+    def test_unbounded_sides(self):
+        """None bounds behave as minus/plus infinity."""
+        tree = IntervalTree()
+        tree.insert(VersionRange(None, V2), "below")
+        tree.insert(VersionRange(V3, None), "above")
+        tree.insert(VersionRange(), "any")
+
+        assert sorted(tree.query_point(V1)) == ["any", "below"]
+        assert sorted(tree.query_point(V2)) == ["any"]
+        assert sorted(tree.query_point(V4)) == ["above", "any"]
+
+    def test_overlapping_intervals(self):
+        """All intervals containing the point are reported."""
+        tree = IntervalTree()
+        tree.insert(VersionRange(V1, V3), 1)
+        tree.insert(VersionRange(V2, V4), 2)
+        tree.insert(VersionRange(V1, V2), 3)
+
+        assert sorted(tree.query_point(V2)) == [1, 2]
+        assert len(tree) == 3
+
+    def test_matches_linear_scan(self):
+        """Randomized cross-check against a brute-force contains() scan."""
+        rng = random.Random(42)
+        versions = [Version(f"{i}.0.0") for i in range(1, 21)]
+
+        ranges = []
+        tree = IntervalTree()
+        for i in range(100):
+            lo, hi = sorted(rng.sample(versions, 2))
+            version_range = VersionRange(lo, hi, rng.random() < 0.5, rng.random() < 0.5)
+            ranges.append(version_range)
+            tree.insert(version_range, i)
+
+        for probe in versions:
+            expected = sorted(
+                i for i, r in enumerate(ranges) if r.contains(probe)
+            )
+            assert sorted(tree.query_point(probe)) == expected
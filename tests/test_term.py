@@ -7,40 +7,49 @@ from pubgrub_resolver.term import Term
 from pubgrub_resolver.package import Package
 from pubgrub_resolver.version import Version, VersionRange
 
+# Shared value-object constants; Package and Version are immutable, so the
+# tests reuse one instance per distinct value instead of re-parsing it in
+# every method.
+PKG = Package("test")
+V1 = Version("1.0.0")
+V15 = Version("1.5.0")
+V2 = Version("2.0.0")
+V25 = Version("2.5.0")
+V3 = Version("3.0.0")
+V4 = Version("4.0.0")
+
 
 class TestTerm:
     """Test Term class functionality."""
 
     def test_term_creation(self):
         """Test basic term creation."""
-        pkg = Package("test")
-        version_range = VersionRange(Version("1.0.0"), Version("2.0.0"))
+        version_range = VersionRange(V1, V2)
 
         # Positive term
-        term1 = Term(pkg, version_range, True)
-        assert term1.package == pkg
+        term1 = Term(PKG, version_range, True)
+        assert term1.package == PKG
         assert term1.version_range == version_range
         assert term1.positive is True
 
         # Negative term
-        term2 = Term(pkg, version_range, False)
-        assert term2.package == pkg
+        term2 = Term(PKG, version_range, False)
+        assert term2.package == PKG
         assert term2.version_range == version_range
         assert term2.positive is False
 
         # Default positive
-        term3 = Term(pkg, version_range)
+        term3 = Term(PKG, version_range)
         assert term3.positive is True
 
     def test_term_negation(self):
         """Test term negation."""
-        pkg = Package("test")
-        version_range = VersionRange(Version("1.0.0"), Version("2.0.0"))
+        version_range = VersionRange(V1, V2)
 
-        term = Term(pkg, version_range, True)
+        term = Term(PKG, version_range, True)
         negated = term.negate()
 
-        assert negated.package == pkg
+        assert negated.package == PKG
         assert negated.version_range == version_range
         assert negated.positive is False
 
@@ -49,45 +58,30 @@ class TestTerm:
 
     def test_term_intersection_both_positive(self):
         """Test intersection of two positive terms."""
-        pkg = Package("test")
-        v1 = Version("1.0.0")
-        v2 = Version("2.0.0")
-        v3 = Version("1.5.0")
-        v4 = Version("2.5.0")
 
-        term1 = Term(pkg, VersionRange(v1, v4))  # [1.0.0, 2.5.0)
-        term2 = Term(pkg, VersionRange(v3, v2))  # [1.5.0, 2.0.0)
+        term1 = Term(PKG, VersionRange(V1, V25))  # [1.0.0, 2.5.0)
+        term2 = Term(PKG, VersionRange(V15, V2))  # [1.5.0, 2.0.0)
 
         intersection = term1.intersect(term2)
         assert intersection is not None
         assert intersection.positive is True
-        assert intersection.version_range.min_version == v3
-        assert intersection.version_range.max_version == v2
+        assert intersection.version_range.min_version == V15
+        assert intersection.version_range.max_version == V2
 
     def test_term_intersection_both_positive_no_overlap(self):
         """Test intersection of two positive terms with no overlap."""
-        pkg = Package("test")
-        v1 = Version("1.0.0")
-        v2 = Version("2.0.0")
-        v3 = Version("3.0.0")
-        v4 = Version("4.0.0")
 
-        term1 = Term(pkg, VersionRange(v1, v2))  # [1.0.0, 2.0.0)
-        term2 = Term(pkg, VersionRange(v3, v4))  # [3.0.0, 4.0.0)
+        term1 = Term(PKG, VersionRange(V1, V2))  # [1.0.0, 2.0.0)
+        term2 = Term(PKG, VersionRange(V3, V4))  # [3.0.0, 4.0.0)
 
         intersection = term1.intersect(term2)
         assert intersection is None
 
     def test_term_intersection_both_negative(self):
         """Test intersection of two negative terms."""
-        pkg = Package("test")
-        v1 = Version("1.0.0")
-        v2 = Version("2.0.0")
-        v3 = Version("1.5.0")
-        v4 = Version("2.5.0")
 
-        term1 = Term(pkg, VersionRange(v1, v4), False)  # NOT [1.0.0, 2.5.0)
-        term2 = Term(pkg, VersionRange(v3, v2), False)  # NOT [1.5.0, 2.0.0)
+        term1 = Term(PKG, VersionRange(V1, V25), False)  # NOT [1.0.0, 2.5.0)
+        term2 = Term(PKG, VersionRange(V15, V2), False)  # NOT [1.5.0, 2.0.0)
 
         intersection = term1.intersect(term2)
         # This is intersection of two negative terms with overlapping ranges
@@ -96,39 +90,30 @@ class TestTerm:
         # So the result should be NOT [1.0.0, 2.5.0)
         assert intersection is not None
         assert intersection.positive is False
-        expected_range = VersionRange(v1, v4)  # [1.0.0, 2.5.0)
+        expected_range = VersionRange(V1, V25)  # [1.0.0, 2.5.0)
         assert intersection.version_range == expected_range
 
     def test_term_intersection_both_negative_correctness(self):
         """Test that negative term intersection is mathematically correct."""
-        pkg = Package("test")
-        v1 = Version("1.0.0")
-        v2 = Version("2.0.0")
-        v3 = Version("3.0.0")
 
         # NOT [1.0.0, 2.0.0) AND NOT [2.0.0, 3.0.0)
         # Should be NOT ([1.0.0, 2.0.0) OR [2.0.0, 3.0.0)) = NOT [1.0.0, 3.0.0)
-        term1 = Term(pkg, VersionRange(v1, v2), False)  # NOT [1.0.0, 2.0.0)
-        term2 = Term(pkg, VersionRange(v2, v3), False)  # NOT [2.0.0, 3.0.0)
+        term1 = Term(PKG, VersionRange(V1, V2), False)  # NOT [1.0.0, 2.0.0)
+        term2 = Term(PKG, VersionRange(V2, V3), False)  # NOT [2.0.0, 3.0.0)
 
         intersection = term1.intersect(term2)
 
         # This is what the correct behavior should be:
-        expected_range = VersionRange(v1, v3)
+        expected_range = VersionRange(V1, V3)
         assert intersection is not None
         assert intersection.positive is False
         assert intersection.version_range == expected_range
 
     def test_term_intersection_positive_negative_no_overlap(self):
         """Test intersection of positive and negative terms with no overlap."""
-        pkg = Package("test")
-        v1 = Version("1.0.0")
-        v2 = Version("2.0.0")
-        v3 = Version("3.0.0")
-        v4 = Version("4.0.0")
 
-        term1 = Term(pkg, VersionRange(v1, v2), True)  # [1.0.0, 2.0.0)
-        term2 = Term(pkg, VersionRange(v3, v4), False)  # NOT [3.0.0, 4.0.0)
+        term1 = Term(PKG, VersionRange(V1, V2), True)  # [1.0.0, 2.0.0)
+        term2 = Term(PKG, VersionRange(V3, V4), False)  # NOT [3.0.0, 4.0.0)
 
         intersection = term1.intersect(term2)
         assert intersection is not None
@@ -137,20 +122,16 @@ class TestTerm:
 
     def test_term_intersection_positive_negative_overlap(self):
         """Test intersection of positive and negative terms with overlap."""
-        pkg = Package("test")
-        v1 = Version("1.0.0")
-        v2 = Version("2.0.0")
-        v3 = Version("1.5.0")
 
-        term1 = Term(pkg, VersionRange(v1, v2), True)  # [1.0.0, 2.0.0)
-        term2 = Term(pkg, VersionRange(v3, v2), False)  # NOT [1.5.0, 2.0.0)
+        term1 = Term(PKG, VersionRange(V1, V2), True)  # [1.0.0, 2.0.0)
+        term2 = Term(PKG, VersionRange(V15, V2), False)  # NOT [1.5.0, 2.0.0)
 
         intersection = term1.intersect(term2)
         # Should compute [1.0.0, 2.0.0) ∩ NOT [1.5.0, 2.0.0) = [1.0.0, 1.5.0)
         assert intersection is not None
         assert intersection.positive is True
-        assert intersection.version_range.min_version == v1
-        assert intersection.version_range.max_version == v3
+        assert intersection.version_range.min_version == V1
+        assert intersection.version_range.max_version == V15
         assert intersection.version_range.include_min is True
         assert intersection.version_range.include_max is False
 
@@ -158,7 +139,7 @@ class TestTerm:
         """Test intersection of terms for different packages."""
         pkg1 = Package("test1")
         pkg2 = Package("test2")
-        version_range = VersionRange(Version("1.0.0"), Version("2.0.0"))
+        version_range = VersionRange(V1, V2)
 
         term1 = Term(pkg1, version_range)
         term2 = Term(pkg2, version_range)
@@ -168,55 +149,38 @@ class TestTerm:
 
     def test_term_satisfies_both_positive(self):
         """Test satisfies relationship for positive terms."""
-        pkg = Package("test")
-        v1 = Version("1.0.0")
-        v2 = Version("2.0.0")
-        v3 = Version("1.5.0")
 
         # term1 is more restrictive than term2
-        term1 = Term(pkg, VersionRange(v3, v2))  # [1.5.0, 2.0.0)
-        term2 = Term(pkg, VersionRange(v1, v2))  # [1.0.0, 2.0.0)
+        term1 = Term(PKG, VersionRange(V15, V2))  # [1.5.0, 2.0.0)
+        term2 = Term(PKG, VersionRange(V1, V2))  # [1.0.0, 2.0.0)
 
         assert term1.satisfies(term2)
         assert not term2.satisfies(term1)
 
     def test_term_satisfies_both_negative(self):
         """Test satisfies relationship for negative terms."""
-        pkg = Package("test")
-        v1 = Version("1.0.0")
-        v2 = Version("2.0.0")
-        v3 = Version("1.5.0")
 
         # NOT term1 is more restrictive than NOT term2
-        term1 = Term(pkg, VersionRange(v1, v2), False)  # NOT [1.0.0, 2.0.0)
-        term2 = Term(pkg, VersionRange(v3, v2), False)  # NOT [1.5.0, 2.0.0)
+        term1 = Term(PKG, VersionRange(V1, V2), False)  # NOT [1.0.0, 2.0.0)
+        term2 = Term(PKG, VersionRange(V15, V2), False)  # NOT [1.5.0, 2.0.0)
 
         assert term1.satisfies(term2)
         assert not term2.satisfies(term1)
 
     def test_term_satisfies_positive_negative_no_overlap(self):
         """Test satisfies relationship for positive and negative terms with no overlap."""
-        pkg = Package("test")
-        v1 = Version("1.0.0")
-        v2 = Version("2.0.0")
-        v3 = Version("3.0.0")
-        v4 = Version("4.0.0")
 
-        term1 = Term(pkg, VersionRange(v1, v2), True)  # [1.0.0, 2.0.0)
-        term2 = Term(pkg, VersionRange(v3, v4), False)  # NOT [3.0.0, 4.0.0)
+        term1 = Term(PKG, VersionRange(V1, V2), True)  # [1.0.0, 2.0.0)
+        term2 = Term(PKG, VersionRange(V3, V4), False)  # NOT [3.0.0, 4.0.0)
 
         assert term1.satisfies(term2)
         assert not term2.satisfies(term1)
 
     def test_term_satisfies_positive_negative_overlap(self):
         """Test satisfies relationship for positive and negative terms with overlap."""
-        pkg = Package("test")
-        v1 = Version("1.0.0")
-        v2 = Version("2.0.0")
-        v3 = Version("1.5.0")
 
-        term1 = Term(pkg, VersionRange(v1, v2), True)  # [1.0.0, 2.0.0)
-        term2 = Term(pkg, VersionRange(v3, v2), False)  # NOT [1.5.0, 2.0.0)
+        term1 = Term(PKG, VersionRange(V1, V2), True)  # [1.0.0, 2.0.0)
+        term2 = Term(PKG, VersionRange(V15, V2), False)  # NOT [1.5.0, 2.0.0)
 
         assert not term1.satisfies(term2)
         assert not term2.satisfies(term1)
@@ -225,7 +189,7 @@ class TestTerm:
         """Test satisfies relationship for different packages."""
         pkg1 = Package("test1")
         pkg2 = Package("test2")
-        version_range = VersionRange(Version("1.0.0"), Version("2.0.0"))
+        version_range = VersionRange(V1, V2)
 
         term1 = Term(pkg1, version_range)
         term2 = Term(pkg2, version_range)
@@ -235,30 +199,27 @@ class TestTerm:
 
     def test_term_is_failure(self):
         """Test failure detection."""
-        pkg = Package("test")
-        v1 = Version("1.0.0")
 
         # Normal positive term
-        term1 = Term(pkg, VersionRange(v1, None))
+        term1 = Term(PKG, VersionRange(V1, None))
         assert not term1.is_failure()
 
         # Negative term (never a failure)
-        term2 = Term(pkg, VersionRange(v1, None), False)
+        term2 = Term(PKG, VersionRange(V1, None), False)
         assert not term2.is_failure()
 
         # Empty positive term (failure)
-        empty_range = VersionRange(v1, v1, include_min=False, include_max=False)
-        term3 = Term(pkg, empty_range)
+        empty_range = VersionRange(V1, V1, include_min=False, include_max=False)
+        term3 = Term(PKG, empty_range)
         assert term3.is_failure()
 
     def test_term_equality(self):
         """Test term equality."""
-        pkg = Package("test")
-        version_range = VersionRange(Version("1.0.0"), Version("2.0.0"))
+        version_range = VersionRange(V1, V2)
 
-        term1 = Term(pkg, version_range, True)
-        term2 = Term(pkg, version_range, True)
-        term3 = Term(pkg, version_range, False)
+        term1 = Term(PKG, version_range, True)
+        term2 = Term(PKG, version_range, True)
+        term3 = Term(PKG, version_range, False)
 
         assert term1 == term2
         assert term1 != term3
@@ -267,14 +228,13 @@ class TestTerm:
 
     def test_term_string_representation(self):
         """Test string representation of terms."""
-        pkg = Package("test")
-        version_range = VersionRange(Version("1.0.0"), Version("2.0.0"))
+        version_range = VersionRange(V1, V2)
 
-        term1 = Term(pkg, version_range, True)
+        term1 = Term(PKG, version_range, True)
         assert "test" in str(term1)
         assert "NOT" not in str(term1)
 
-        term2 = Term(pkg, version_range, False)
+        term2 = Term(PKG, version_range, False)
         assert "test" in str(term2)
         assert "NOT" in str(term2)
 
@@ -286,7 +246,6 @@ class TestTermStressTests:
 
     def test_complex_term_intersections(self):
         """Test complex term intersections with many overlapping ranges."""
-        pkg = Package("test")
         versions = [Version(f"{i}.0.0") for i in range(1, 11)]
 
         # Create multiple overlapping positive terms - this is a challenging stress test
@@ -295,7 +254,7 @@ class TestTermStressTests:
             len(versions) - 3
         ):  # -3 to ensure versions[i + 3] doesn't go out of bounds
             range_obj = VersionRange(versions[i], versions[i + 3])
-            terms.append(Term(pkg, range_obj, True))
+            terms.append(Term(PKG, range_obj, True))
 
         # Intersect all terms - this should result in a very narrow intersection or None
         result = terms[0]
@@ -312,18 +271,44 @@ class TestTermStressTests:
             assert not result.is_failure()
         # If result is None, that's also valid - it means no common intersection exists
 
+    def test_pairwise_intersection_sweep(self):
+        """Sweep every pair of [lo, hi) ranges over a ten-version pool.
+
+        The versions and ranges are built once up front, so the loop body
+        is nothing but intersection calls; this covers all 45x45 range
+        pairings in well under a second while checking the invariants
+        that hold for any positive-term intersection.
+        """
+        versions = [Version(f"{i}.0.0") for i in range(1, 11)]
+        ranges = [
+            VersionRange(versions[i], versions[j])
+            for i in range(len(versions))
+            for j in range(i + 1, len(versions))
+        ]
+        terms = [Term(PKG, r, True) for r in ranges]
+
+        for term1 in terms:
+            for term2 in terms:
+                result = term1.intersect(term2)
+                reversed_result = term2.intersect(term1)
+
+                # Intersection is commutative, including the None cases.
+                assert result == reversed_result
+
+                if result is not None:
+                    assert result.positive is True
+                    assert not result.is_failure()
+                    # The intersection can be no wider than either input.
+                    assert result.satisfies(term1)
+                    assert result.satisfies(term2)
+
     def test_term_satisfies_chains(self):
         """Test chains of satisfies relationships."""
-        pkg = Package("test")
-        v1 = Version("1.0.0")
-        v2 = Version("2.0.0")
-        v3 = Version("3.0.0")
-        v4 = Version("4.0.0")
 
         # Create a chain where term1 satisfies term2, term2 satisfies term3
-        term1 = Term(pkg, VersionRange(v2, v3))  # [2.0.0, 3.0.0)
-        term2 = Term(pkg, VersionRange(v1, v3))  # [1.0.0, 3.0.0)
-        term3 = Term(pkg, VersionRange(v1, v4))  # [1.0.0, 4.0.0)
+        term1 = Term(PKG, VersionRange(V2, V3))  # [2.0.0, 3.0.0)
+        term2 = Term(PKG, VersionRange(V1, V3))  # [1.0.0, 3.0.0)
+        term3 = Term(PKG, VersionRange(V1, V4))  # [1.0.0, 4.0.0)
 
         assert term1.satisfies(term2)
         assert term2.satisfies(term3)
@@ -331,11 +316,8 @@ class TestTermStressTests:
 
     def test_term_negation_stress(self):
         """Test multiple negations and intersections."""
-        pkg = Package("test")
-        v1 = Version("1.0.0")
-        v2 = Version("2.0.0")
 
-        term = Term(pkg, VersionRange(v1, v2))
+        term = Term(PKG, VersionRange(V1, V2))
 
         # Multiple negations should return to original
         negated = term.negate()
@@ -349,22 +331,20 @@ class TestTermStressTests:
 
     def test_edge_case_version_ranges(self):
         """Test terms with edge case version ranges."""
-        pkg = Package("test")
-        v1 = Version("1.0.0")
 
         # Single point range
-        single_point = VersionRange(v1, v1, include_min=True, include_max=True)
-        term1 = Term(pkg, single_point)
+        single_point = VersionRange(V1, V1, include_min=True, include_max=True)
+        term1 = Term(PKG, single_point)
         assert not term1.is_failure()
 
         # Empty range
-        empty_range = VersionRange(v1, v1, include_min=False, include_max=False)
-        term2 = Term(pkg, empty_range)
+        empty_range = VersionRange(V1, V1, include_min=False, include_max=False)
+        term2 = Term(PKG, empty_range)
         assert term2.is_failure()
 
         # Unbounded range
         unbounded = VersionRange()
-        term3 = Term(pkg, unbounded)
+        term3 = Term(PKG, unbounded)
         assert not term3.is_failure()
 
         # Test intersections with these edge cases
@@ -374,21 +354,19 @@ class TestTermStressTests:
 
     def test_term_with_prerelease_versions(self):
         """Test terms with pre-release versions."""
-        pkg = Package("test")
         v1 = Version("1.0.0-alpha")
         v2 = Version("1.0.0-beta")
-        v3 = Version("1.0.0")
 
-        term1 = Term(pkg, VersionRange(v1, v2))
-        term2 = Term(pkg, VersionRange(v2, v3))
+        term1 = Term(PKG, VersionRange(v1, v2))
+        term2 = Term(PKG, VersionRange(v2, V1))
 
         # These should not intersect at v2 (exclusive upper bound)
         intersection = term1.intersect(term2)
         assert intersection is None
 
         # Test with inclusive bounds
-        term3 = Term(pkg, VersionRange(v1, v2, include_max=True))
-        term4 = Term(pkg, VersionRange(v2, v3, include_min=True))
+        term3 = Term(PKG, VersionRange(v1, v2, include_max=True))
+        term4 = Term(PKG, VersionRange(v2, V1, include_min=True))
 
         intersection2 = term3.intersect(term4)
         assert intersection2 is not None
@@ -7,162 +7,73 @@ from pubgrub_resolver.term import Term
 
 
 class TestTermIntersectionAdvanced:
-    """Test cases for advanced term intersection scenarios."""
-
-    def setup_method(self):
-        """Set up test package."""
-        self.pkg = Package("test")
-
-    def test_both_positive_terms_intersection(self):
-        """Test intersection of two positive terms."""
-        term1 = Term(
-            self.pkg,
-            VersionRange(Version("1.0.0"), Version("3.0.0"), True, False),
-            True,
-        )  # [1.0.0, 3.0.0)
-        term2 = Term(
-            self.pkg,
-            VersionRange(Version("2.0.0"), Version("4.0.0"), True, False),
-            True,
-        )  # [2.0.0, 4.0.0)
-
-        result = term1.intersect(term2)
-
-        assert result is not None
-        assert result.positive is True
-        assert result.version_range.min_version == Version("2.0.0")
-        assert result.version_range.max_version == Version("3.0.0")
-        assert result.version_range.include_min is True
-        assert result.version_range.include_max is False
-
-    def test_both_positive_terms_no_intersection(self):
-        """Test intersection of two positive terms with no overlap."""
-        term1 = Term(
-            self.pkg,
-            VersionRange(Version("1.0.0"), Version("2.0.0"), True, False),
-            True,
-        )  # [1.0.0, 2.0.0)
-        term2 = Term(
-            self.pkg,
-            VersionRange(Version("3.0.0"), Version("4.0.0"), True, False),
-            True,
-        )  # [3.0.0, 4.0.0)
-
-        result = term1.intersect(term2)
-
-        assert result is None
-
-    def test_both_negative_terms_intersection(self):
-        """Test intersection of two negative terms."""
+    """Test cases for advanced term intersection scenarios.
+
+    The sign/overlap matrix lives in one parametrized table: each row is
+    (a_min, a_max, a_pos, b_min, b_max, b_pos, exp_min, exp_max, exp_pos),
+    with exp_min None meaning the intersection must be empty. All ranges
+    use the default [min, max) bounds. The package under test is shared as
+    a class attribute; Package instances are interned and read-only, so
+    every row can reuse the same object.
+    """
+
+    pkg = Package("test")
+
+    @pytest.mark.parametrize(
+        ("a_min", "a_max", "a_pos", "b_min", "b_max", "b_pos", "exp_min", "exp_max", "exp_pos"),
+        [
+            # [1,3) AND [2,4) = [2,3)
+            ("1.0.0", "3.0.0", True, "2.0.0", "4.0.0", True, "2.0.0", "3.0.0", True),
+            # [1,2) AND [3,4) = empty
+            ("1.0.0", "2.0.0", True, "3.0.0", "4.0.0", True, None, None, None),
+            # NOT [1,2) AND NOT [1.5,2.5) = NOT [1,2.5)
+            ("1.0.0", "2.0.0", False, "1.5.0", "2.5.0", False, "1.0.0", "2.5.0", False),
+            # [1,3) AND NOT [2,4) = [1,2)
+            ("1.0.0", "3.0.0", True, "2.0.0", "4.0.0", False, "1.0.0", "2.0.0", True),
+            # NOT [1,2) AND [1.5,3) = [2,3)
+            ("1.0.0", "2.0.0", False, "1.5.0", "3.0.0", True, "2.0.0", "3.0.0", True),
+            # [1,2) AND NOT [3,4) = [1,2) (no overlap)
+            ("1.0.0", "2.0.0", True, "3.0.0", "4.0.0", False, "1.0.0", "2.0.0", True),
+            # NOT [3,4) AND [1,2) = [1,2) (no overlap)
+            ("3.0.0", "4.0.0", False, "1.0.0", "2.0.0", True, "1.0.0", "2.0.0", True),
+            # [1,2) AND NOT [2,3) = [1,2) (adjacent boundary)
+            ("1.0.0", "2.0.0", True, "2.0.0", "3.0.0", False, "1.0.0", "2.0.0", True),
+        ],
+        ids=[
+            "both_positive",
+            "both_positive_disjoint",
+            "both_negative",
+            "positive_negative_overlap",
+            "negative_positive_overlap",
+            "positive_negative_disjoint",
+            "negative_positive_disjoint",
+            "adjacent_boundary",
+        ],
+    )
+    def test_term_intersection(
+        self, a_min, a_max, a_pos, b_min, b_max, b_pos, exp_min, exp_max, exp_pos
+    ):
+        """Intersect two terms and check the resulting range and sign."""
         term1 = Term(
-            self.pkg,
-            VersionRange(Version("1.0.0"), Version("2.0.0"), True, False),
-            False,
-        )  # NOT [1.0.0, 2.0.0)
+            self.pkg, VersionRange(Version(a_min), Version(a_max), True, False), a_pos
+        )
         term2 = Term(
-            self.pkg,
-            VersionRange(Version("1.5.0"), Version("2.5.0"), True, False),
-            False,
-        )  # NOT [1.5.0, 2.5.0)
+            self.pkg, VersionRange(Version(b_min), Version(b_max), True, False), b_pos
+        )
 
         result = term1.intersect(term2)
 
-        # Should be NOT [1.0.0, 2.5.0) since NOT A AND NOT B = NOT (A OR B)
-        assert result is not None
-        assert result.positive is False
-        assert result.version_range.min_version == Version("1.0.0")
-        assert result.version_range.max_version == Version("2.5.0")
-        assert result.version_range.include_min is True
-        assert result.version_range.include_max is False
+        if exp_min is None:
+            assert result is None
+            return
 
-    def test_positive_and_negative_intersection(self):
-        """Test intersection of positive and negative terms."""
-        term1 = Term(
-            self.pkg,
-            VersionRange(Version("1.0.0"), Version("3.0.0"), True, False),
-            True,
-        )  # [1.0.0, 3.0.0)
-        term2 = Term(
-            self.pkg,
-            VersionRange(Version("2.0.0"), Version("4.0.0"), True, False),
-            False,
-        )  # NOT [2.0.0, 4.0.0)
-
-        result = term1.intersect(term2)
-
-        # Should be [1.0.0, 3.0.0) ∩ NOT [2.0.0, 4.0.0) = [1.0.0, 2.0.0)
         assert result is not None
-        assert result.positive is True
-        assert result.version_range.min_version == Version("1.0.0")
-        assert result.version_range.max_version == Version("2.0.0")
+        assert result.positive is exp_pos
+        assert result.version_range.min_version == Version(exp_min)
+        assert result.version_range.max_version == Version(exp_max)
         assert result.version_range.include_min is True
         assert result.version_range.include_max is False
 
-    def test_negative_and_positive_intersection(self):
-        """Test intersection of negative and positive terms."""
-        term1 = Term(
-            self.pkg,
-            VersionRange(Version("1.0.0"), Version("2.0.0"), True, False),
-            False,
-        )  # NOT [1.0.0, 2.0.0)
-        term2 = Term(
-            self.pkg,
-            VersionRange(Version("1.5.0"), Version("3.0.0"), True, False),
-            True,
-        )  # [1.5.0, 3.0.0)
-
-        result = term1.intersect(term2)
-
-        # Should be NOT [1.0.0, 2.0.0) ∩ [1.5.0, 3.0.0) = [2.0.0, 3.0.0)
-        assert result is not None
-        assert result.positive is True
-        assert result.version_range.min_version == Version("2.0.0")
-        assert result.version_range.max_version == Version("3.0.0")
-        assert result.version_range.include_min is True
-        assert result.version_range.include_max is False
-
-    def test_positive_negative_no_overlap(self):
-        """Test positive and negative terms with no overlap."""
-        term1 = Term(
-            self.pkg,
-            VersionRange(Version("1.0.0"), Version("2.0.0"), True, False),
-            True,
-        )  # [1.0.0, 2.0.0)
-        term2 = Term(
-            self.pkg,
-            VersionRange(Version("3.0.0"), Version("4.0.0"), True, False),
-            False,
-        )  # NOT [3.0.0, 4.0.0)
-
-        result = term1.intersect(term2)
-
-        # No overlap, so positive term should be unaffected
-        assert result is not None
-        assert result.positive is True
-        assert result.version_range.min_version == Version("1.0.0")
-        assert result.version_range.max_version == Version("2.0.0")
-
-    def test_negative_positive_no_overlap(self):
-        """Test negative and positive terms with no overlap."""
-        term1 = Term(
-            self.pkg,
-            VersionRange(Version("3.0.0"), Version("4.0.0"), True, False),
-            False,
-        )  # NOT [3.0.0, 4.0.0)
-        term2 = Term(
-            self.pkg,
-            VersionRange(Version("1.0.0"), Version("2.0.0"), True, False),
-            True,
-        )  # [1.0.0, 2.0.0)
-
-        result = term1.intersect(term2)
-
-        # No overlap, so positive term should be unaffected
-        assert result is not None
-        assert result.positive is True
-        assert result.version_range.min_version == Version("1.0.0")
-        assert result.version_range.max_version == Version("2.0.0")
-
     def test_different_packages_intersection(self):
         """Test intersection of terms for different packages."""
         pkg1 = Package("package1")
@@ -180,27 +91,3 @@ class TestTermIntersectionAdvanced:
             ValueError, match="Cannot intersect terms for different packages"
         ):
             term1.intersect(term2)
-
-    def test_complex_boundary_conditions(self):
-        """Test intersection with complex boundary conditions."""
-        # Test adjacent ranges
-        term1 = Term(
-            self.pkg,
-            VersionRange(Version("1.0.0"), Version("2.0.0"), True, False),
-            True,
-        )  # [1.0.0, 2.0.0)
-        term2 = Term(
-            self.pkg,
-            VersionRange(Version("2.0.0"), Version("3.0.0"), True, False),
-            False,
-        )  # NOT [2.0.0, 3.0.0)
-
-        result = term1.intersect(term2)
-
-        # Should be [1.0.0, 2.0.0) since they don't overlap
-        assert result is not None
-        assert result.positive is True
-        assert result.version_range.min_version == Version("1.0.0")
-        assert result.version_range.max_version == Version("2.0.0")
-        assert result.version_range.include_min is True
-        assert result.version_range.include_max is False
@@ -18,6 +18,15 @@ class TestVersion:
         assert v.pre_release is None
         assert v.build is None
 
+    def test_version_from_ints(self):
+        """Test the parse-free integer constructor."""
+        v = Version.from_ints(1, 2, 3)
+        assert v == Version("1.2.3")
+        assert str(v) == "1.2.3"
+        assert hash(v) == hash(Version("1.2.3"))
+        assert v.pre_release is None
+        assert v.build is None
+
     def test_version_with_prerelease(self):
         """Test version with pre-release."""
         v = Version("1.2.3-alpha.1")
@@ -308,6 +317,9 @@ class TestVersionStressTests:
 
         assert sorted_versions == versions
 
+        # The key-based bulk sort must agree with the dunder-based one.
+        assert Version.sort_many(shuffled) == versions
+
     def test_complex_range_intersections(self):
         """Test complex range intersections."""
         v1 = Version("1.0.0")
@@ -1,7 +1,75 @@
 """Tests for VersionSet complement operation."""
 
+import pytest
+
 from pubgrub_resolver.version import Version, VersionRange, VersionSet
 
+# Shared fixtures hoisted to module scope: versions are interned and the
+# sets (plus their precomputed complements) are immutable by convention,
+# so every test can reuse the same objects instead of rebuilding them.
+V05 = Version("0.5.0")
+V1 = Version("1.0.0")
+V15 = Version("1.5.0")
+V2 = Version("2.0.0")
+V21 = Version("2.1.0")
+V25 = Version("2.5.0")
+V3 = Version("3.0.0")
+V35 = Version("3.5.0")
+V4 = Version("4.0.0")
+V45 = Version("4.5.0")
+
+SINGLE_1_2 = VersionSet([VersionRange(V1, V2, True, False)])
+SINGLE_1_2_COMPLEMENT = SINGLE_1_2.complement()
+
+MULTI_1_2_3_4 = VersionSet(
+    [
+        VersionRange(V1, V2, True, False),
+        VersionRange(V3, V4, True, False),
+    ]
+)
+MULTI_1_2_3_4_COMPLEMENT = MULTI_1_2_3_4.complement()
+
+# (1.0.0, 2.0.0] with the boundary inclusivity swapped relative to the
+# default, so the complement keeps 1.0.0 and drops 2.0.0.
+EXCLUSIVE_MIN_1_2 = VersionSet([VersionRange(V1, V2, False, True)])
+EXCLUSIVE_MIN_1_2_COMPLEMENT = EXCLUSIVE_MIN_1_2.complement()
+
+# Flat (set, version, expected) table for the containment behavior of the
+# hoisted sets and their complements; one parametrized test covers the
+# whole matrix and each row shows up as its own test case.
+CONTAINS_CASES = [
+    (SINGLE_1_2, V05, False),
+    (SINGLE_1_2, V1, True),
+    (SINGLE_1_2, V15, True),
+    (SINGLE_1_2, V2, False),
+    (SINGLE_1_2, V25, False),
+    (SINGLE_1_2_COMPLEMENT, V05, True),
+    (SINGLE_1_2_COMPLEMENT, V1, False),
+    (SINGLE_1_2_COMPLEMENT, V15, False),
+    (SINGLE_1_2_COMPLEMENT, V2, True),
+    (SINGLE_1_2_COMPLEMENT, V25, True),
+    (EXCLUSIVE_MIN_1_2_COMPLEMENT, V1, True),
+    (EXCLUSIVE_MIN_1_2_COMPLEMENT, V15, False),
+    (EXCLUSIVE_MIN_1_2_COMPLEMENT, V2, False),
+    (EXCLUSIVE_MIN_1_2_COMPLEMENT, V21, True),
+]
+CONTAINS_IDS = [
+    "single-before",
+    "single-min",
+    "single-inside",
+    "single-max",
+    "single-after",
+    "single-comp-before",
+    "single-comp-min",
+    "single-comp-inside",
+    "single-comp-max",
+    "single-comp-after",
+    "excl-min-comp-min",
+    "excl-min-comp-inside",
+    "excl-min-comp-max",
+    "excl-min-comp-after",
+]
+
 
 class TestVersionSetComplement:
     """Test cases for VersionSet complement operation."""
@@ -14,90 +82,65 @@ class TestVersionSetComplement:
         assert len(universal_set.ranges) == 1
         assert universal_set.ranges[0].min_version is None
         assert universal_set.ranges[0].max_version is None
-        assert universal_set.contains(Version("1.0.0"))
+        assert universal_set.contains(V1)
         assert universal_set.contains(Version("0.1.0"))
         assert universal_set.contains(Version("100.0.0"))
 
     def test_single_range_complement(self):
         """Test complement of a single range."""
-        single_range = VersionSet(
-            [VersionRange(Version("1.0.0"), Version("2.0.0"), True, False)]
-        )
-        complement = single_range.complement()
-
-        # Should have two ranges: (<∞, 1.0.0) and [2.0.0, ∞)
-        assert len(complement.ranges) == 2
-
-        # Test original set containment
-        assert not single_range.contains(Version("0.5.0"))
-        assert single_range.contains(Version("1.0.0"))
-        assert single_range.contains(Version("1.5.0"))
-        assert not single_range.contains(Version("2.0.0"))
-        assert not single_range.contains(Version("2.5.0"))
-
-        # Test complement containment (should be opposite)
-        assert complement.contains(Version("0.5.0"))
-        assert not complement.contains(Version("1.0.0"))
-        assert not complement.contains(Version("1.5.0"))
-        assert complement.contains(Version("2.0.0"))
-        assert complement.contains(Version("2.5.0"))
+        # Should have two ranges: (<∞, 1.0.0) and [2.0.0, ∞); the
+        # per-version behavior lives in the CONTAINS_CASES table.
+        assert len(SINGLE_1_2_COMPLEMENT.ranges) == 2
+
+    @pytest.mark.parametrize(
+        ("version_set", "version", "expected"), CONTAINS_CASES, ids=CONTAINS_IDS
+    )
+    def test_contains(self, version_set, version, expected):
+        """Check one containment row from the shared case table."""
+        assert version_set.contains(version) is expected
 
     def test_multiple_ranges_complement(self):
         """Test complement of multiple disjoint ranges."""
-        multi_range = VersionSet(
-            [
-                VersionRange(Version("1.0.0"), Version("2.0.0"), True, False),
-                VersionRange(Version("3.0.0"), Version("4.0.0"), True, False),
-            ]
-        )
-        complement = multi_range.complement()
-
         # Should have three ranges: (<∞, 1.0.0), [2.0.0, 3.0.0), [4.0.0, ∞)
-        assert len(complement.ranges) == 3
+        assert len(MULTI_1_2_3_4_COMPLEMENT.ranges) == 3
 
-        # Test specific versions
-        assert complement.contains(Version("0.5.0"))  # Before first range
-        assert not complement.contains(Version("1.5.0"))  # In first range
-        assert complement.contains(Version("2.5.0"))  # Between ranges
-        assert not complement.contains(Version("3.5.0"))  # In second range
-        assert complement.contains(Version("4.5.0"))  # After second range
+        # Before, inside, and between the ranges, checked in one batch
+        assert MULTI_1_2_3_4_COMPLEMENT.contains_many([V05, V15, V25, V35, V45]) == [
+            True,
+            False,
+            True,
+            False,
+            True,
+        ]
 
     def test_complement_normalization_disabled(self):
         """Test that complement operation doesn't normalize ranges incorrectly."""
-        single_range = VersionSet(
-            [VersionRange(Version("1.0.0"), Version("2.0.0"), True, False)]
-        )
-        complement = single_range.complement()
-
         # The complement should have exactly 2 ranges, not be normalized to "any"
-        assert len(complement.ranges) == 2
+        assert len(SINGLE_1_2_COMPLEMENT.ranges) == 2
 
-        # Verify the ranges are what we expect
-        ranges = sorted(
-            complement.ranges, key=lambda r: (r.min_version is not None, r.min_version)
-        )
+        # Complement output is sorted by construction; index it directly.
+        ranges = SINGLE_1_2_COMPLEMENT.ranges
 
         # First range: (<∞, 1.0.0)
         assert ranges[0].min_version is None
-        assert ranges[0].max_version == Version("1.0.0")
+        assert ranges[0].max_version == V1
         assert ranges[0].include_min is True
         assert ranges[0].include_max is False
 
         # Second range: [2.0.0, ∞)
-        assert ranges[1].min_version == Version("2.0.0")
+        assert ranges[1].min_version == V2
         assert ranges[1].max_version is None
         assert ranges[1].include_min is True
         assert ranges[1].include_max is False
 
     def test_complement_edge_cases(self):
-        """Test complement with edge cases like inclusive/exclusive boundaries."""
-        # Test exclusive min, inclusive max
-        range_set = VersionSet(
-            [VersionRange(Version("1.0.0"), Version("2.0.0"), False, True)]
-        )
-        complement = range_set.complement()
-
-        assert complement.contains(Version("1.0.0"))  # Excluded from original
-        assert not complement.contains(Version("1.5.0"))  # Included in original
-        assert not complement.contains(Version("2.0.0"))  # Included in original
-        assert complement.contains(Version("2.1.0"))  # Excluded from original
+        """Test complement structure with swapped boundary inclusivity."""
+        # Containment rows are in CONTAINS_CASES; check the boundary
+        # flags survive complementation here.
+        ranges = EXCLUSIVE_MIN_1_2_COMPLEMENT.ranges
+
+        assert len(ranges) == 2
+        assert ranges[0].max_version == V1
+        assert ranges[0].include_max is True
+        assert ranges[1].min_version == V2
+        assert ranges[1].include_min is False